@@ -16,6 +16,11 @@ Version: 0.0.3
 import streamlit as st
 import pandas as pd
 
+# Copy-on-Write lets transformation steps share column data instead of taking
+# eager deep copies. It is always enabled from pandas 3.0 onwards.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 _imported_classes = {}
 
 try:
@@ -657,64 +662,58 @@ def main():
             st.markdown("Select the workflow that best fits your data processing needs:")
             st.markdown("")  # Spacing for readability
             
-            col1, col2, col3 = st.columns(3)
+            workflow_types = {
+                "workflow_single": "single",
+                "workflow_multiple": "multiple",
+                "workflow_amr": "amr",
+                "workflow_glass": "glass",
+                "workflow_whonet": "whonet",
+            }
             
-            with col1:
-                if ui_components.workflow_card(
-                    title="Standardize Single File",
-                    description="Process and standardize individual data files with mapping, transformation, and validation.",
-                    icon="📄",
-                    features=[
+            clicked = ui_components.render_workflow_cards([
+                {
+                    "title": "Standardize Single File",
+                    "description": "Process and standardize individual data files with mapping, transformation, and validation.",
+                    "icon": "📄",
+                    "features": [
                         "Column mapping & renaming",
                         "Data transformation",
                         "Quality validation",
                         "Multi-format export"
                     ],
-                    button_label="Start Single File Workflow",
-                    button_key="workflow_single",
-                    recommended=False
-                ):
-                    st.session_state['workflow_type'] = 'single'
-                    st.session_state['workflow_selected'] = True
-                    st.rerun()
-            
-            with col2:
-                if ui_components.workflow_card(
-                    title="Merge Multiple Files",
-                    description="Intelligently combine multiple files with automatic column mapping and data harmonization.",
-                    icon="📚",
-                    features=[
+                    "button_label": "Start Single File Workflow",
+                    "button_key": "workflow_single",
+                    "recommended": False
+                },
+                {
+                    "title": "Merge Multiple Files",
+                    "description": "Intelligently combine multiple files with automatic column mapping and data harmonization.",
+                    "icon": "📚",
+                    "features": [
                         "Smart column matching",
                         "Automatic data merging",
                         "Duplicate detection",
                         "Unified export"
                     ],
-                    button_label="Start Merge Workflow",
-                    button_key="workflow_multiple",
-                    recommended=True
-                ):
-                    st.session_state['workflow_type'] = 'multiple'
-                    st.session_state['workflow_selected'] = True
-                    st.rerun()
-            
-            with col3:
-                if ui_components.workflow_card(
-                    title="AMR Analytics",
-                    description="Advanced antimicrobial resistance analysis with CLSI compliance and statistical validation.",
-                    icon="🧬",
-                    features=[
+                    "button_label": "Start Merge Workflow",
+                    "button_key": "workflow_multiple",
+                    "recommended": True
+                },
+                {
+                    "title": "AMR Analytics",
+                    "description": "Advanced antimicrobial resistance analysis with CLSI compliance and statistical validation.",
+                    "icon": "🧬",
+                    "features": [
                         "CLSI-compliant analysis",
                         "Resistance rate calculations",
                         "Professional visualizations",
                         "Statistical reports"
                     ],
-                    button_label="Start AMR Analysis",
-                    button_key="workflow_amr",
-                    recommended=False
-                ):
-                    st.session_state['workflow_type'] = 'amr'
-                    st.session_state['workflow_selected'] = True
-                    st.rerun()
+                    "button_label": "Start AMR Analysis",
+                    "button_key": "workflow_amr",
+                    "recommended": False
+                },
+            ], ncols=3)
             
             # Add GLASS and WHONET Preparation Wizards as prominent options
             st.markdown("---")
@@ -725,46 +724,43 @@ def main():
                 unsafe_allow_html=True
             )
             
-            col1, col2 = st.columns(2)
-            with col1:
-                if ui_components.workflow_card(
-                    title="GLASS Preparation Wizard",
-                    description="Step-by-step guided process to clean, standardize, and prepare your AMR data for GLASS submission. No programming required!",
-                    icon="🧬",
-                    features=[
+            clicked = ui_components.render_workflow_cards([
+                {
+                    "title": "GLASS Preparation Wizard",
+                    "description": "Step-by-step guided process to clean, standardize, and prepare your AMR data for GLASS submission. No programming required!",
+                    "icon": "🧬",
+                    "features": [
                         "Automatic data cleaning",
                         "GLASS format standardization",
                         "Step-by-step guidance",
                         "Built-in validation",
                         "Ready for submission"
                     ],
-                    button_label="Start GLASS Wizard",
-                    button_key="workflow_glass",
-                    recommended=True
-                ):
-                    st.session_state['workflow_type'] = 'glass'
-                    st.session_state['workflow_selected'] = True
-                    st.rerun()
-            
-            with col2:
-                if ui_components.workflow_card(
-                    title="WHONET Preparation Wizard",
-                    description="Step-by-step guided process to clean, standardize, and prepare your AMR data for WHONET import. No programming required!",
-                    icon="🔬",
-                    features=[
+                    "button_label": "Start GLASS Wizard",
+                    "button_key": "workflow_glass",
+                    "recommended": True
+                },
+                {
+                    "title": "WHONET Preparation Wizard",
+                    "description": "Step-by-step guided process to clean, standardize, and prepare your AMR data for WHONET import. No programming required!",
+                    "icon": "🔬",
+                    "features": [
                         "Automatic data cleaning",
                         "WHONET format standardization",
                         "Comprehensive quality reports",
                         "Built-in validation",
                         "Ready for WHONET import"
                     ],
-                    button_label="Start WHONET Wizard",
-                    button_key="workflow_whonet",
-                    recommended=True
-                ):
-                    st.session_state['workflow_type'] = 'whonet'
-                    st.session_state['workflow_selected'] = True
-                    st.rerun()
+                    "button_label": "Start WHONET Wizard",
+                    "button_key": "workflow_whonet",
+                    "recommended": True
+                },
+            ], ncols=2) or clicked
+            
+            if clicked:
+                st.session_state['workflow_type'] = workflow_types[clicked]
+                st.session_state['workflow_selected'] = True
+                st.rerun()
             
             st.info("""
             **Why use the wizards?**
@@ -1470,8 +1466,8 @@ def main():
                         else:
                             st.info("ℹ️ Your data has been processed. Review the quality assessment above before import.")
                         
-                        # Use the exporter's interface
-                        exporter.show_export_interface(final_df, None)
+                        # Use the exporter's interface, with dates written in WHONET format
+                        exporter.show_export_interface(whonet_wizard.standardizer.to_whonet_export(final_df), None)
                         
             except Exception as e:
                 st.error(f"❌ Error in WHONET Wizard: {str(e)}")
@@ -10,6 +10,7 @@ import subprocess
 import time
 import signal
 import atexit
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
@@ -30,13 +31,12 @@ def check_dependencies():
         'openpyxl', 'xlsxwriter', 'psutil'
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # Locate packages without importing them; the app runs in a separate
+    # Streamlit process, so loading them here would only slow down startup
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         print(f"❌ Missing dependencies: {', '.join(missing_packages)}")
@@ -0,0 +1,50 @@
+"""
+Unit tests for transformer module.
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.transformer import DataTransformer
+
+
+class TestDataTransformer(unittest.TestCase):
+    """Tests for DataTransformer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.transformer = DataTransformer()
+
+    def test_extract_numbers_batch_keeps_per_column_dtype(self):
+        """Test that batch extraction converts each column on its own."""
+        df = pd.DataFrame({
+            'Zone': ['S-65', 'R-12', 'I-7'],
+            'MIC': ['MIC 4', None, 'n/a'],
+        })
+        result = self.transformer._extract_numbers_batch(df, ['Zone', 'MIC'])
+
+        self.assertEqual(list(result), ['Zone', 'MIC'])
+        self.assertTrue(pd.api.types.is_integer_dtype(result['Zone']))
+        self.assertEqual(result['Zone'].tolist(), [65, 12, 7])
+        self.assertEqual(result['MIC'].iloc[0], 4)
+        self.assertTrue(np.isnan(result['MIC'].iloc[1]))
+        self.assertTrue(np.isnan(result['MIC'].iloc[2]))
+
+    def test_extract_numbers_batch_duplicate_column_names(self):
+        """Test that duplicate column names do not break extraction."""
+        df = pd.DataFrame([['S-65', 'x1'], ['R-12', 'x2']], columns=['Zone', 'Zone'])
+        result = self.transformer._extract_numbers_batch(df, ['Zone'])
+
+        self.assertEqual(result['Zone'].tolist(), [65, 12])
+        self.assertEqual(list(result['Zone'].index), [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
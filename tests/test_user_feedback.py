@@ -0,0 +1,62 @@
+"""
+Unit tests for user_feedback module.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.user_feedback import UserFeedback
+
+
+class TestUserFeedback(unittest.TestCase):
+    """Tests for UserFeedback message routing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.feedback = UserFeedback()
+        patcher = mock.patch('utils.user_feedback.st')
+        self.st = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_notification_success_and_info_use_toast(self):
+        """Test that success and info notifications are shown as toasts."""
+        self.feedback.show_notification("Saved", "Done", type="success")
+        self.feedback.show_notification("Note", "FYI", type="info")
+
+        self.assertEqual(self.st.toast.call_count, 2)
+        self.st.success.assert_not_called()
+        self.st.info.assert_not_called()
+
+    def test_notification_error_and_warning_render_inline(self):
+        """Test that error and warning notifications are never toasts."""
+        self.feedback.show_notification("Failed", "Bad file", type="error")
+        self.feedback.show_notification("Check", "Odd values", type="warning")
+
+        self.st.toast.assert_not_called()
+        self.st.error.assert_called_once_with("**Failed**\n\nBad file")
+        self.st.warning.assert_called_once_with("**Check**\n\nOdd values")
+
+    def test_show_error_and_warning_render_inline(self):
+        """Test that show_error and show_warning ignore the duration."""
+        self.feedback.show_error("Failed", duration=5)
+        self.feedback.show_warning("Check")
+
+        self.st.toast.assert_not_called()
+        self.st.error.assert_called_once()
+        self.st.warning.assert_called_once()
+
+    def test_persistent_success_renders_inline(self):
+        """Test that persistent notifications skip the toast."""
+        self.feedback.show_notification("Saved", "Done", type="success", persistent=True)
+
+        self.st.toast.assert_not_called()
+        self.st.success.assert_called_once_with("**Saved**\n\nDone")
+
+
+if __name__ == '__main__':
+    unittest.main()
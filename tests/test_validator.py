@@ -77,6 +77,67 @@ class TestDataValidator(unittest.TestCase):
         error_types = [e['type'] for e in results['errors']]
         self.assertIn('invalid_values', error_types)
 
+    def test_validate_data_invalid_patient_id_format(self):
+        """Test validation detects Patient_ID values with an invalid format."""
+        df = pd.DataFrame({
+            'Patient_ID': ['P0001', 'p0002'],  # Lowercase is invalid
+            'Age': [25, 30],
+            'Gender': ['M', 'F'],
+            'Date_of_Admission': ['2024-01-01', '2024-01-02'],
+            'Specimen_Type': ['Blood', 'Urine'],
+            'Organism': ['E. coli', 'S. aureus']
+        })
+        results = self.validator.validate_data(df)
+        error_types = [e['type'] for e in results['errors']]
+        self.assertIn('invalid_format', error_types)
+        self.assertEqual(results['warnings'], [])
+
+    def test_validate_data_invalid_patient_id_format_string_dtype(self):
+        """Test the format check on a string-dtype Patient_ID column."""
+        df = pd.DataFrame({
+            'Patient_ID': pd.Series(['P0001', 'p0002'], dtype='string'),
+            'Age': [25, 30],
+            'Gender': ['M', 'F'],
+            'Date_of_Admission': ['2024-01-01', '2024-01-02'],
+            'Specimen_Type': ['Blood', 'Urine'],
+            'Organism': ['E. coli', 'S. aureus']
+        })
+        results = self.validator.validate_data(df)
+        format_errors = [e for e in results['errors'] if e['type'] == 'invalid_format']
+        self.assertEqual(len(format_errors), 1)
+        self.assertEqual(format_errors[0]['rows'], [1])
+        self.assertEqual(results['warnings'], [])
+
+    def test_validate_data_age_out_of_range_with_text(self):
+        """Test age range checks tolerate non-numeric entries."""
+        df = pd.DataFrame({
+            'Patient_ID': ['P001', 'P002', 'P003'],
+            'Age': [25, 'unknown', 130],  # Text and out-of-range age
+            'Gender': ['M', 'F', 'M'],
+            'Date_of_Admission': ['2024-01-01', '2024-01-02', '2024-01-03'],
+            'Specimen_Type': ['Blood', 'Urine', 'Blood'],
+            'Organism': ['E. coli', 'S. aureus', 'K. pneumoniae']
+        })
+        results = self.validator.validate_data(df)
+        error_types = [e['type'] for e in results['errors']]
+        self.assertIn('non_numeric', error_types)
+        self.assertIn('above_maximum', error_types)
+
+    def test_validate_data_missing_age_not_non_numeric(self):
+        """Test missing ages are reported as missing, not as non-numeric."""
+        df = pd.DataFrame({
+            'Patient_ID': ['P0001', 'P0002'],
+            'Age': [25, None],
+            'Gender': ['M', 'F'],
+            'Date_of_Admission': ['2024-01-01', '2024-01-02'],
+            'Specimen_Type': ['Blood', 'Urine'],
+            'Organism': ['E. coli', 'S. aureus']
+        })
+        results = self.validator.validate_data(df)
+        error_types = [e['type'] for e in results['errors']]
+        self.assertIn('missing_values', error_types)
+        self.assertNotIn('non_numeric', error_types)
+
     def test_validate_data_empty_dataframe(self):
         """Test validation handles empty dataframe."""
         df = pd.DataFrame()
@@ -0,0 +1,33 @@
+"""
+Unit tests for whonet_standardizer module.
+"""
+
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.whonet_standardizer import WHONETStandardizer
+
+
+class TestWHONETStandardizer(unittest.TestCase):
+    """Tests for WHONETStandardizer partial-match lookups."""
+
+    def test_match_organism_overlapping_keys(self):
+        """Test that overlapping keys resolve to the first-listed mapping."""
+        # 'e coli' overlaps 'k pneumoniae' and is listed first
+        self.assertEqual(WHONETStandardizer._match_organism('k pneumoniae coli'), 'E. coli')
+
+    def test_match_organism_no_match(self):
+        """Test that text without a known key returns None."""
+        self.assertIsNone(WHONETStandardizer._match_organism('unknown bug'))
+
+    def test_match_specimen_partial(self):
+        """Test a partial specimen match inside longer text."""
+        self.assertEqual(WHONETStandardizer._match_specimen('mid-stream urine sample'), 'URINE')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,6 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import Dict, List, Tuple, Optional, Union
 import io
-import base64
 from datetime import datetime
 import logging
 import warnings
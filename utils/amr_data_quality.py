@@ -19,6 +19,14 @@ import re
 from datetime import datetime
 import streamlit as st
 
+# Column-name fragments identifying antimicrobial susceptibility columns
+_ANTIMICROBIAL_INDICATOR_RE = re.compile('|'.join(map(re.escape, [
+    '_sir', '_nd', '_nm', '_r', '_s', '_i',
+    'ampicillin', 'amoxicillin', 'cefuroxime', 'cefotaxime', 'ceftriaxone',
+    'gentamicin', 'ciprofloxacin', 'meropenem', 'imipenem', 'vancomycin',
+    'azithromycin', 'erythromycin', 'clindamycin', 'tetracycline', 'chloramphenicol'
+])))
+
 class AMRDataQuality:
     """
     Comprehensive AMR data quality assessment and improvement.
@@ -341,17 +349,11 @@ class AMRDataQuality:
         specimen_cols = [col for col in df.columns if 'specimen' in col.lower() and 'type' in col.lower()]
         if specimen_cols:
             for col in specimen_cols:
-                specimens = df[col].dropna().unique()
-                case_variations = {}
-                for spec in specimens:
-                    spec_lower = str(spec).lower().strip()
-                    if spec_lower not in case_variations:
-                        case_variations[spec_lower] = []
-                    case_variations[spec_lower].append(str(spec))
-                
-                inconsistent = {k: v for k, v in case_variations.items() if len(set(v)) > 1}
+                specimens = pd.Series(df[col].dropna().unique()).astype(str)
+                spellings = specimens.groupby(specimens.str.lower().str.strip(), sort=False).nunique()
+                inconsistent = int((spellings > 1).sum())
                 if inconsistent:
-                    consistency['specimen_consistency'][col] = len(inconsistent)
+                    consistency['specimen_consistency'][col] = inconsistent
                     consistency['issues'].append(f"Found case inconsistencies in {col}")
         
         # Antimicrobial result consistency
@@ -558,20 +560,9 @@ class AMRDataQuality:
         """Identify antimicrobial susceptibility columns (case-insensitive)."""
         from .column_utils import normalize_column_name
         
-        antimicrobial_indicators = [
-            '_sir', '_nd', '_nm', '_r', '_s', '_i',
-            'ampicillin', 'amoxicillin', 'cefuroxime', 'cefotaxime', 'ceftriaxone',
-            'gentamicin', 'ciprofloxacin', 'meropenem', 'imipenem', 'vancomycin',
-            'azithromycin', 'erythromycin', 'clindamycin', 'tetracycline', 'chloramphenicol'
-        ]
-        
-        antimicrobial_cols = []
-        for col in df.columns:
-            col_normalized = normalize_column_name(col)  # Case-insensitive, strip whitespace
-            if any(indicator in col_normalized for indicator in antimicrobial_indicators):
-                antimicrobial_cols.append(col)
-        
-        return antimicrobial_cols
+        # normalize_column_name is case-insensitive and strips whitespace
+        return [col for col in df.columns
+                if _ANTIMICROBIAL_INDICATOR_RE.search(normalize_column_name(col))]
     
     def _calculate_amr_quality_score(self, report: Dict[str, Any]) -> float:
         """Calculate overall AMR quality score."""
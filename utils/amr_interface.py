@@ -13,9 +13,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import io
-import base64
 from typing import Dict, List, Optional, Union
 import zipfile
 from datetime import datetime
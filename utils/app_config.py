@@ -2,7 +2,6 @@
 Application configuration management
 """
 
-import os
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
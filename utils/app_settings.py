@@ -4,7 +4,6 @@ Enhanced application settings and configuration management
 
 import streamlit as st
 import json
-import os
 from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
@@ -11,6 +11,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Column-name fragments marking AST data: breakpoint markers, common
+# antimicrobial abbreviations and resistance phenotype terms, matched in one scan
+_AST_COLUMN_RE = re.compile('|'.join(map(re.escape, [
+    '_nd', '_nm', 'zone', 'mic', 'breakpoint',
+    'amp', 'amc', 'amk', 'azm', 'chl', 'cip', 'caz', 'ctx', 'cro',
+    'fox', 'gen', 'mem', 'nal', 'oxy', 'pef', 'sxt', 'tcy', 'tmp', 'van',
+    'resistance', 'susceptibility', 'phenotype'
+])))
+
 class ASTDataDetector:
     """
     Detects AST data format and provides appropriate processing methods
@@ -131,19 +140,7 @@ class ASTDataDetector:
         
         # Look for columns with common AST patterns
         for col in df.columns:
-            col_lower = col.lower()
-            
-            # Check for antimicrobial name patterns
-            if any(pattern in col_lower for pattern in ['_nd', '_nm', 'zone', 'mic', 'breakpoint']):
-                ast_columns.append(col)
-            # Check for common antimicrobial abbreviations
-            elif any(am in col_lower for am in [
-                'amp', 'amc', 'amk', 'azm', 'chl', 'cip', 'caz', 'ctx', 'cro', 
-                'fox', 'gen', 'mem', 'nal', 'oxy', 'pef', 'sxt', 'tcy', 'tmp', 'van'
-            ]):
-                ast_columns.append(col)
-            # Check for resistance phenotype columns
-            elif any(pattern in col_lower for pattern in ['resistance', 'susceptibility', 'phenotype']):
+            if _AST_COLUMN_RE.search(col.lower()):
                 ast_columns.append(col)
         
         return ast_columns
@@ -178,14 +175,9 @@ class ASTDataDetector:
                 breakpoint_matches += matches
             
             # Check for numeric values that could be breakpoints
-            numeric_values = 0
-            for val in sample_values:
-                try:
-                    num_val = float(val)
-                    if 0 <= num_val <= 100:  # Reasonable range for zone diameters or MIC
-                        numeric_values += 1
-                except (ValueError, TypeError):
-                    pass
+            # Reasonable range for zone diameters or MIC
+            numeric_sample = pd.to_numeric(pd.Series(sample_values), errors='coerce')
+            numeric_values = int(numeric_sample.between(0, 100).sum())
             
             total_samples = len(sample_values)
             interpreted_ratio = interpreted_matches / total_samples if total_samples > 0 else 0
@@ -5,7 +5,6 @@ Advanced caching system for improved performance
 import streamlit as st
 import pandas as pd
 import hashlib
-import pickle
 import time
 from typing import Any, Optional, Callable
 from functools import wraps
@@ -5,11 +5,10 @@ Provides comprehensive data profiling and statistical analysis.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 class DataProfiler:
     """Provides comprehensive data profiling and analysis."""
@@ -27,12 +26,15 @@ class DataProfiler:
         Returns:
             Dictionary containing profiling results
         """
+        # Row duplicates feed both the overview and the duplicate analysis
+        duplicate_mask = df.duplicated()
+        
         profile = {
-            'overview': self._get_overview_stats(df),
+            'overview': self._get_overview_stats(df, duplicate_mask),
             'columns': self._profile_columns(df),
             'data_types': self._analyze_data_types(df),
             'missing_data': self._analyze_missing_data(df),
-            'duplicates': self._analyze_duplicates(df),
+            'duplicates': self._analyze_duplicates(df, duplicate_mask),
             'outliers': self._detect_outliers(df),
             'correlations': self._calculate_correlations(df),
             'patterns': self._detect_patterns(df)
@@ -41,15 +43,18 @@ class DataProfiler:
         self.profile_results = profile
         return profile
     
-    def _get_overview_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _get_overview_stats(self, df: pd.DataFrame,
+                            duplicate_mask: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Get overview statistics."""
+        if duplicate_mask is None:
+            duplicate_mask = df.duplicated()
         return {
             'total_rows': len(df),
             'total_columns': len(df.columns),
             'memory_usage_mb': df.memory_usage(deep=True).sum() / 1024**2,
             'total_cells': df.size,
             'empty_cells': df.isna().sum().sum(),
-            'duplicate_rows': df.duplicated().sum(),
+            'duplicate_rows': duplicate_mask.sum(),
             'numeric_columns': len(df.select_dtypes(include=[np.number]).columns),
             'text_columns': len(df.select_dtypes(include=['object']).columns),
             'datetime_columns': len(df.select_dtypes(include=['datetime']).columns)
@@ -146,10 +151,12 @@ class DataProfiler:
             'rows_with_missing_percentage': (rows_with_missing / len(df)) * 100
         }
     
-    def _analyze_duplicates(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_duplicates(self, df: pd.DataFrame,
+                            duplicate_mask: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Analyze duplicate data."""
-        duplicate_rows = df.duplicated()
-        duplicate_count = duplicate_rows.sum()
+        if duplicate_mask is None:
+            duplicate_mask = df.duplicated()
+        duplicate_count = duplicate_mask.sum()
         
         # Find duplicate values in individual columns
         column_duplicates = {}
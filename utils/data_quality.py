@@ -5,7 +5,7 @@ Provides comprehensive data quality scoring and analysis.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import streamlit as st
 
 class DataQualityAssessor:
@@ -38,12 +38,15 @@ class DataQualityAssessor:
             'score': 0.0
         }
         
+        # Row duplicates feed both the uniqueness score and the issue list
+        duplicate_rows = df.duplicated().sum()
+        
         # Calculate individual metrics
         completeness = self._calculate_completeness(df)
         consistency = self._calculate_consistency(df)
         accuracy = self._calculate_accuracy(df)
         validity = self._calculate_validity(df)
-        uniqueness = self._calculate_uniqueness(df)
+        uniqueness = self._calculate_uniqueness(df, duplicate_rows)
         
         # Store metrics
         results['metrics'] = {
@@ -61,7 +64,7 @@ class DataQualityAssessor:
         results['score'] = overall_score
         
         # Generate issues and recommendations
-        results['issues'] = self._identify_issues(df, results['metrics'])
+        results['issues'] = self._identify_issues(df, results['metrics'], duplicate_rows)
         results['recommendations'] = self._generate_recommendations(results['issues'])
         
         return results
@@ -84,14 +87,13 @@ class DataQualityAssessor:
                 unique_values = df[col].dropna().unique()
                 if len(unique_values) > 0:
                     # Check for mixed case inconsistencies
-                    case_variations = set(str(val).lower() for val in unique_values)
-                    if len(case_variations) < len(unique_values):
+                    unique_str = pd.Series(unique_values).astype(str)
+                    if unique_str.str.lower().nunique() < len(unique_values):
                         consistency_issues += 1
                     total_checks += 1
                     
                     # Check for whitespace inconsistencies
-                    whitespace_issues = sum(1 for val in unique_values if str(val) != str(val).strip())
-                    if whitespace_issues > 0:
+                    if (unique_str != unique_str.str.strip()).any():
                         consistency_issues += 1
                     total_checks += 1
         
@@ -135,14 +137,16 @@ class DataQualityAssessor:
         validity = 1 - (validity_issues / total_checks) if total_checks > 0 else 1
         return round(validity, 3)
     
-    def _calculate_uniqueness(self, df: pd.DataFrame) -> float:
+    def _calculate_uniqueness(self, df: pd.DataFrame, duplicate_rows: Optional[int] = None) -> float:
         """Calculate uniqueness score (0-1)."""
         total_rows = len(df)
-        duplicate_rows = df.duplicated().sum()
+        if duplicate_rows is None:
+            duplicate_rows = df.duplicated().sum()
         uniqueness = 1 - (duplicate_rows / total_rows) if total_rows > 0 else 1
         return round(uniqueness, 3)
     
-    def _identify_issues(self, df: pd.DataFrame, metrics: Dict[str, float]) -> List[Dict[str, Any]]:
+    def _identify_issues(self, df: pd.DataFrame, metrics: Dict[str, float],
+                         duplicate_rows: Optional[int] = None) -> List[Dict[str, Any]]:
         """Identify specific data quality issues."""
         issues = []
         
@@ -177,7 +181,7 @@ class DataQualityAssessor:
         
         # Uniqueness issues
         if metrics['uniqueness'] < 0.95:
-            duplicate_count = df.duplicated().sum()
+            duplicate_count = df.duplicated().sum() if duplicate_rows is None else duplicate_rows
             issues.append({
                 'type': 'uniqueness',
                 'severity': 'low',
@@ -12,7 +12,6 @@ from plotly.subplots import make_subplots
 from typing import Dict, List, Tuple, Optional, Union
 import logging
 from scipy import stats
-from scipy.stats import beta
 import warnings
 from .cache_manager import streamlit_cache_dataframe
 
@@ -492,22 +491,16 @@ class EnhancedAMRAnalytics:
                                            antibiogram: pd.DataFrame):
         """Add confidence interval annotations to the heatmap"""
         try:
-            # Create CI pivot table
-            ci_lower = resistance_rates.pivot_table(
+            # Create both CI pivot tables from a single grouping pass
+            ci_bounds = resistance_rates.pivot_table(
                 index='Organism',
                 columns='Antimicrobial',
-                values='CI_Lower_%',
-                fill_value=np.nan,
-                aggfunc='mean'
-            )
-            
-            ci_upper = resistance_rates.pivot_table(
-                index='Organism',
-                columns='Antimicrobial',
-                values='CI_Upper_%',
+                values=['CI_Lower_%', 'CI_Upper_%'],
                 fill_value=np.nan,
                 aggfunc='mean'
             )
+            ci_lower = ci_bounds['CI_Lower_%']
+            ci_upper = ci_bounds['CI_Upper_%']
             
             # Add annotations for significant results
             annotations = []
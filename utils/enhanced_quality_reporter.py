@@ -11,6 +11,12 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 
+# Case-consistency checks are skipped for free-text and identifier columns:
+# above this many distinct values, or when most values are distinct
+_CASE_CHECK_MAX_UNIQUE = 10_000
+_CASE_CHECK_MIN_UNIQUE_FOR_RATIO = 100
+_CASE_CHECK_MAX_UNIQUE_RATIO = 0.5
+
 class EnhancedQualityReporter:
     """
     Enhanced data quality reporting with comprehensive metrics, visualizations, and actionable insights.
@@ -93,14 +99,16 @@ class EnhancedQualityReporter:
     def _analyze_completeness(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Comprehensive completeness analysis."""
         total_cells = df.size
-        missing_cells = df.isna().sum().sum()
+        # One null mask shared by the overall, column and row figures
+        null_mask = df.isna().to_numpy()
+        missing_by_column = null_mask.sum(axis=0)
+        missing_cells = missing_by_column.sum()
         completeness_pct = (1 - (missing_cells / total_cells)) * 100 if total_cells > 0 else 0
         
         # Column-level completeness
         column_completeness = {}
-        for col in df.columns:
-            missing = df[col].isna().sum()
-            total = len(df)
+        total = len(df)
+        for col, missing in zip(df.columns, missing_by_column):
             column_completeness[col] = {
                 'missing_count': int(missing),
                 'missing_pct': (missing / total * 100) if total > 0 else 0,
@@ -108,7 +116,7 @@ class EnhancedQualityReporter:
             }
         
         # Row-level completeness
-        row_completeness = df.notna().sum(axis=1) / len(df.columns) * 100
+        row_completeness = pd.Series(len(df.columns) - null_mask.sum(axis=1)) / len(df.columns) * 100
         
         return {
             'overall_pct': round(completeness_pct, 2),
@@ -134,25 +142,30 @@ class EnhancedQualityReporter:
             if df[col].dtype == 'object':
                 values = df[col].dropna()
                 if len(values) > 0:
-                    # Case consistency
-                    case_variations = {}
-                    for val in values:
-                        val_lower = str(val).lower()
-                        if val_lower not in case_variations:
-                            case_variations[val_lower] = []
-                        case_variations[val_lower].append(str(val))
-                    
-                    inconsistent_cases = {k: v for k, v in case_variations.items() if len(set(v)) > 1}
-                    if inconsistent_cases:
-                        issues.append({
-                            'column': col,
-                            'type': 'case_inconsistency',
-                            'count': len(inconsistent_cases),
-                            'examples': list(inconsistent_cases.values())[:3]
-                        })
+                    # Case consistency: distinct spellings that collide once lowercased
+                    unique_values = values.unique()
+                    n_unique = len(unique_values)
+                    check_case = not (
+                        n_unique > _CASE_CHECK_MAX_UNIQUE
+                        or (n_unique > _CASE_CHECK_MIN_UNIQUE_FOR_RATIO
+                            and n_unique > _CASE_CHECK_MAX_UNIQUE_RATIO * len(values))
+                    )
+                    if check_case:
+                        spellings = pd.Series(unique_values).astype(str).drop_duplicates()
+                        lowered = spellings.str.lower()
+                        collides = lowered.duplicated(keep=False)
+                        if collides.any():
+                            inconsistent_cases = spellings[collides].groupby(lowered[collides], sort=False)
+                            issues.append({
+                                'column': col,
+                                'type': 'case_inconsistency',
+                                'count': inconsistent_cases.ngroups,
+                                'examples': [group.tolist() for _, group in inconsistent_cases][:3]
+                            })
                     
                     # Whitespace consistency
-                    whitespace_issues = sum(1 for val in values if str(val) != str(val).strip())
+                    str_values = values.astype(str)
+                    whitespace_issues = int((str_values != str_values.str.strip()).sum())
                     if whitespace_issues > 0:
                         issues.append({
                             'column': col,
@@ -201,26 +214,18 @@ class EnhancedQualityReporter:
             # Check against context-specific rules
             if col in validation_rules:
                 rules = validation_rules[col]
+                values = df[col].dropna()
                 invalid_count = 0
                 
-                for idx, value in df[col].items():
-                    if pd.isna(value):
-                        continue
-                    
-                    # Check allowed values
-                    if 'allowed_values' in rules:
-                        if str(value).upper() not in [v.upper() for v in rules['allowed_values']]:
-                            invalid_count += 1
-                    
-                    # Check value range
-                    if 'range' in rules and pd.api.types.is_numeric_dtype(df[col]):
-                        min_val, max_val = rules['range']
-                        try:
-                            val = float(value)
-                            if val < min_val or val > max_val:
-                                invalid_count += 1
-                        except (ValueError, TypeError):
-                            invalid_count += 1
+                # Check allowed values
+                if 'allowed_values' in rules:
+                    allowed = [v.upper() for v in rules['allowed_values']]
+                    invalid_count += int((~values.astype(str).str.upper().isin(allowed)).sum())
+                
+                # Check value range
+                if 'range' in rules and pd.api.types.is_numeric_dtype(values):
+                    min_val, max_val = rules['range']
+                    invalid_count += int(((values < min_val) | (values > max_val)).sum())
                 
                 if invalid_count > 0:
                     issues.append({
@@ -234,8 +239,9 @@ class EnhancedQualityReporter:
             if df[col].dtype == 'object':
                 # Check for suspicious characters
                 suspicious_chars = ['<', '>', '|', '\\', '/', '\x00']
+                str_values = df[col].astype(str)
                 for char in suspicious_chars:
-                    count = df[col].astype(str).str.contains(char, regex=False, na=False).sum()
+                    count = str_values.str.contains(char, regex=False, na=False).sum()
                     if count > 0:
                         issues.append({
                             'column': col,
@@ -16,6 +16,8 @@ from typing import Dict, List, Any, Optional, Tuple
 import re
 from datetime import datetime
 
+from .helpers import map_unique
+
 class GLASSStandardizer:
     """
     Comprehensive GLASS data standardization for non-technical users.
@@ -155,6 +157,9 @@ class GLASSStandardizer:
         'not applicable': 'ND'
     }
     
+    # Results are compared upper-cased, so the lookup is keyed the same way
+    ANTIMICROBIAL_RESULT_LOOKUP = {key.upper(): value for key, value in ANTIMICROBIAL_RESULT_MAPPINGS.items()}
+    
     def __init__(self):
         """Initialize GLASS standardizer."""
         self.cleaning_report = {
@@ -287,7 +292,7 @@ class GLASSStandardizer:
             # Return title case if no mapping found
             return str(name).strip().title()
         
-        df[organism_col] = df[organism_col].apply(standardize_organism)
+        df[organism_col] = map_unique(df[organism_col], standardize_organism)
         
         # Rename to standard name if different
         if organism_col != 'Organism':
@@ -327,7 +332,7 @@ class GLASSStandardizer:
             # Return title case if no mapping found
             return str(specimen).strip().title()
         
-        df[spec_type_col] = df[spec_type_col].apply(standardize_specimen)
+        df[spec_type_col] = map_unique(df[spec_type_col], standardize_specimen)
         
         # Rename to standard name if different
         if spec_type_col != 'Specimen type':
@@ -356,7 +361,7 @@ class GLASSStandardizer:
             
             return str(gender).strip().upper()[:1]  # Take first character and uppercase
         
-        df[gender_col] = df[gender_col].apply(standardize_gender)
+        df[gender_col] = map_unique(df[gender_col], standardize_gender)
         
         # Rename to standard name if different
         if gender_col != 'Gender':
@@ -389,12 +394,12 @@ class GLASSStandardizer:
                 value_str = str(value).strip().upper()
                 
                 # Check direct mappings
-                if value_str in self.ANTIMICROBIAL_RESULT_MAPPINGS:
-                    return self.ANTIMICROBIAL_RESULT_MAPPINGS[value_str]
+                if value_str in self.ANTIMICROBIAL_RESULT_LOOKUP:
+                    return self.ANTIMICROBIAL_RESULT_LOOKUP[value_str]
                 
                 # Check partial matches
-                for key, mapped_value in self.ANTIMICROBIAL_RESULT_MAPPINGS.items():
-                    if key.upper() in value_str:
+                for key, mapped_value in self.ANTIMICROBIAL_RESULT_LOOKUP.items():
+                    if key in value_str:
                         return mapped_value
                 
                 # If it's a single character, return uppercase
@@ -403,7 +408,7 @@ class GLASSStandardizer:
                 
                 return value_str
             
-            df[col] = df[col].apply(standardize_result)
+            df[col] = map_unique(df[col], standardize_result)
         
         if antimicrobial_columns:
             self.cleaning_report['issues_fixed'].append(
@@ -7,7 +7,6 @@ import psutil
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional
-from pathlib import Path
 import sys
 
 logger = logging.getLogger(__name__)
@@ -136,6 +136,23 @@ def standardize_value(value: Any) -> Any:
         return value.strip()
     return value
 
+def map_unique(series: pd.Series, standardize) -> pd.Series:
+    """
+    Apply a scalar standardizer once per distinct value and broadcast the results.
+    
+    Args:
+        series: Values to standardize
+        standardize: Function mapping one value to its standardized form
+        
+    Returns:
+        Series of standardized values; missing values stay NaN
+    """
+    # One hashing pass: factorize yields codes (-1 for missing, which picks the
+    # trailing NaN) and the distinct values; categoricals reuse their codes
+    codes, uniques = pd.factorize(series)
+    results = np.array([standardize(value) for value in uniques] + [np.nan], dtype=object)
+    return pd.Series(results[codes], index=series.index, name=series.name)
+
 # detect_date_format is defined later in the file - removing duplicate
 
 def parse_age_value(age_str: str) -> Tuple[Optional[float], str, str]:
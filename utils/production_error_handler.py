@@ -4,7 +4,6 @@ Production-ready error handling with comprehensive logging and recovery
 
 import logging
 import traceback
-import sys
 from datetime import datetime
 from typing import Optional, Dict, Any, Callable
 import functools
@@ -5,7 +5,6 @@ Production logging system for AMR Data Harmonizer
 import logging
 import logging.handlers
 import json
-import os
 import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
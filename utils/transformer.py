@@ -8,7 +8,158 @@ import pandas as pd
 import numpy as np
 import re
 from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+import hashlib
 from datetime import datetime
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+    ne = None
+
+_SPECIAL_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_NUM_RE = re.compile(r'(\d+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DECIMAL_RE = re.compile(r'[\d.]+')
+
+# Column length above which numexpr's fused evaluation beats plain pandas arithmetic
+_NUMEXPR_MIN_ROWS = 200_000
+
+# Number of column deletions that can be undone
+_MAX_DELETION_HISTORY = 10
+
+# Column-name keywords that suggest a column may hold important data
+_IMPORTANT_KEYWORDS = ('id', 'date', 'patient', 'specimen', 'result', 'test', 'lab', 'organism', 'antibiotic')
+_IMPORTANT_RE = re.compile('|'.join(map(re.escape, _IMPORTANT_KEYWORDS)), re.IGNORECASE)
+_IMPORTANT_DELETE_RE = re.compile('|'.join(map(re.escape, _IMPORTANT_KEYWORDS + ('name',))), re.IGNORECASE)
+
+
+def _as_str(x: pd.Series) -> pd.Series:
+    """Return the series as strings, skipping the cast when it already holds only strings."""
+    if pd.api.types.is_string_dtype(x) and not x.hasnans:
+        return x
+    return x.astype(str)
+
+
+def _dtype_group(dtype) -> str:
+    """Classify a dtype as 'number', 'date', 'text' or 'other' for summary counts."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'other'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'number'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'date'
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        return 'text'
+    return 'other'
+
+
+def _as_datetime(x: pd.Series) -> pd.Series:
+    """Return the series as datetimes, only parsing when it is not already datetime-typed."""
+    if pd.api.types.is_datetime64_any_dtype(x.dtype):
+        return x
+    return pd.to_datetime(x, cache=True)
+
+
+def _standardize(x: pd.Series) -> pd.Series:
+    """Z-score a numeric series, fusing the subtract and divide passes via numexpr on large columns."""
+    mean, std = x.mean(), x.std()
+    if NUMEXPR_AVAILABLE and len(x) > _NUMEXPR_MIN_ROWS:
+        arr = x.to_numpy(dtype=np.float64, na_value=np.nan)
+        result = ne.evaluate("(arr - mean) / std", local_dict={'arr': arr, 'mean': mean, 'std': std})
+        return pd.Series(result, index=x.index, name=x.name)
+    return (x - mean) / std
+
+
+def _column_bullets(columns: List[Any]) -> str:
+    """Render column names as one markdown bullet list, so it is sent as a single element."""
+    return "\n".join(f"- `{col}`" for col in columns)
+
+
+def _important_columns(columns: List[Any], pattern: re.Pattern) -> List[Any]:
+    """Return the columns whose names match an important-keyword pattern, in one vectorized scan."""
+    if len(columns) == 0:
+        return []
+    mask = pd.Index(columns).astype(str).str.contains(pattern)
+    return [col for col, is_important in zip(columns, mask) if is_important]
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> Tuple[int, Tuple[int, int], Tuple[Any, ...]]:
+    """Constant-time structural fingerprint of a dataframe (identity, shape and columns)."""
+    return (id(df), df.shape, tuple(df.columns))
+
+
+def _same_frame(cached_df: pd.DataFrame, cached_fp: Tuple, df: pd.DataFrame) -> bool:
+    """
+    Check whether a dataframe is the very object seen on a previous rerun.
+    
+    Callers keep a reference to the cached frame, so its id() cannot be
+    recycled; frames are never mutated in place (edits rebind to new frames),
+    so an unchanged object with the same shape and columns has the same data.
+    """
+    return cached_df is df and cached_fp == _frame_fingerprint(df)
+
+
+def _series_fingerprint(series: pd.Series) -> bytes:
+    """Content digest of a series, used as a cheap cache key for transformations."""
+    hashed = pd.util.hash_pandas_object(series, index=True).values
+    digest = hashlib.blake2b(hashed.tobytes(), digest_size=16)
+    digest.update(str(series.dtype).encode())
+    return digest.digest()
+
+
+@st.cache_data(show_spinner=False)
+def _compute_transform(series_key: bytes, category: str, transform_type: str,
+                       params_key: tuple, _series: pd.Series,
+                       _transform_func: Callable) -> pd.Series:
+    """
+    Compute a single column transformation.
+    
+    Cached on the series fingerprint and transformation arguments so that
+    stored transformations are not recomputed on unrelated Streamlit reruns.
+    Underscore-prefixed arguments are excluded from Streamlit's hashing.
+    """
+    if category == 'text':
+        return _apply_text_transform(_series, _transform_func)
+    return _transform_func(_series, *params_key)
+
+
+def _apply_text_transform(series: pd.Series, transform_func: Callable) -> pd.Series:
+    """
+    Apply a string transformation, working on unique values when cardinality is low.
+    
+    AMR text fields (organisms, antibiotics, specimen types) repeat a handful of
+    values across many rows, so transforming the uniques and broadcasting back
+    through the factorized codes scales with distinct values rather than rows.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    if len(uniques) * 4 >= len(series):
+        return transform_func(series)
+    
+    transformed = transform_func(pd.Series(uniques)).take(codes)
+    transformed.index = series.index
+    transformed.name = series.name
+    return transformed
+
+
+@st.cache_data(show_spinner=False)
+def _empty_column_analysis(df: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Scan a dataframe for fully empty columns.
+    
+    Cached on the dataframe contents so the scan runs once per distinct
+    dataset instead of on every Streamlit rerun.
+    
+    Returns:
+        Tuple of (empty columns, non-empty columns, empty columns whose
+        names suggest they may hold important data)
+    """
+    empty_mask = df.isna().all()
+    empty_cols = df.columns[empty_mask].tolist()
+    non_empty_cols = df.columns[~empty_mask.values].tolist()
+    important_empty_cols = _important_columns(empty_cols, _IMPORTANT_RE)
+    return empty_cols, non_empty_cols, important_empty_cols
+
 
 class DataTransformer:
     """Handles data transformation operations with flexible AMR data cleaning."""
@@ -18,26 +169,35 @@ class DataTransformer:
         self.age_transformer = AgeTransformer()
         self.transformations = {
             'text': {
-                'uppercase': lambda x: x.astype(str).str.upper(),
-                'lowercase': lambda x: x.astype(str).str.lower(),
-                'titlecase': lambda x: x.astype(str).str.title(),
-                'strip': lambda x: x.astype(str).str.strip(),
-                'remove_special_chars': lambda x: x.astype(str).str.replace(r'[^a-zA-Z0-9\s]', '', regex=True),
-                'extract_numbers': lambda x: pd.to_numeric(x.astype(str).str.extract(r'(\d+)', expand=False), errors='coerce')
+                'uppercase': lambda x: _as_str(x).str.upper(),
+                'lowercase': lambda x: _as_str(x).str.lower(),
+                'titlecase': lambda x: _as_str(x).str.title(),
+                'strip': lambda x: _as_str(x).str.strip(),
+                'remove_special_chars': lambda x: _as_str(x).str.replace(_SPECIAL_RE, '', regex=True),
+                'extract_numbers': lambda x: pd.to_numeric(_as_str(x).str.extract(_NUM_RE, expand=False), errors='coerce')
             },
             'number': {
                 'round': lambda x, decimals: x.round(decimals),
                 'absolute': lambda x: x.abs(),
-                'standardize': lambda x: (x - x.mean()) / x.std()
+                'standardize': _standardize
             },
             'date': {
-                'to_iso_date': lambda x: pd.to_datetime(x).dt.date,
-                'extract_year': lambda x: pd.to_datetime(x).dt.year,
-                'extract_month': lambda x: pd.to_datetime(x).dt.month,
-                'extract_day': lambda x: pd.to_datetime(x).dt.day
+                'to_iso_date': lambda x: _as_datetime(x).dt.date,
+                'extract_year': lambda x: _as_datetime(x).dt.year,
+                'extract_month': lambda x: _as_datetime(x).dt.month,
+                'extract_day': lambda x: _as_datetime(x).dt.day
             }
         }
         
+        # Transformation options per dtype kind, built once instead of per call
+        number_types = list(self.transformations['number'].keys())
+        self._text_types = list(self.transformations['text'].keys())
+        self._types_by_kind = {
+            'b': number_types, 'i': number_types, 'u': number_types,
+            'f': number_types, 'c': number_types,
+            'M': list(self.transformations['date'].keys())
+        }
+        
         # Initialize flexible cleaning strategies
         self.cleaning_strategies = self._initialize_cleaning_strategies()
     
@@ -195,7 +355,7 @@ class DataTransformer:
             if strategy['normalize_case']:
                 value_str = value_str.title()
             if strategy['remove_extra_spaces']:
-                value_str = re.sub(r'\s+', ' ', value_str).strip()
+                value_str = _WHITESPACE_RE.sub(' ', value_str).strip()
             
             return value_str
         
@@ -351,7 +511,7 @@ class DataTransformer:
             
             # Extract from text
             if strategy.get('extract_from_text', False):
-                numbers = re.findall(r'[\d.]+', value_str)
+                numbers = _DECIMAL_RE.findall(value_str)
                 if numbers:
                     try:
                         return float(numbers[0])
@@ -473,6 +633,19 @@ class DataTransformer:
         """
         st.write("### Data Transformations")
         
+        from .helpers import prepare_df_for_display
+        
+        # Display-ready preview heads, formatted once per frame and reused by
+        # every section that previews the same data during this run. The frame
+        # is kept alongside so its id() cannot be recycled mid-run.
+        display_heads = {}
+        
+        def display_head(frame: pd.DataFrame, n: int = 10) -> pd.DataFrame:
+            key = id(frame)
+            if key not in display_heads:
+                display_heads[key] = (frame, prepare_df_for_display(frame.head(10)))
+            return display_heads[key][1].head(n)
+        
         # Initialize session state
         if 'transformations' not in st.session_state:
             st.session_state['transformations'] = []
@@ -482,14 +655,12 @@ class DataTransformer:
             st.session_state['transformation_state'] = {
                 'original_columns': list(df.columns),
                 'current_columns': list(df.columns),
-                'operations_applied': []
+                'operations_applied': [],
+                'operations_applied_set': set()
             }
-        # **CRITICAL FIX**: Initialize processed_data if not exists
-        if 'processed_data' not in st.session_state:
-            st.session_state['processed_data'] = df.copy()
-        
         # **CRITICAL FIX**: Always update processed_data with current df
-        st.session_state['processed_data'] = df.copy()
+        # (a shared reference; every edit below rebinds rather than mutates it)
+        st.session_state['processed_data'] = df
         
         # Update current columns tracking
         st.session_state['transformation_state']['current_columns'] = list(df.columns)
@@ -532,8 +703,10 @@ class DataTransformer:
                 # Show detection results
                 if detection_report['detected_columns']:
                     with st.expander("📋 View Detected Columns", expanded=True):
-                        for col_name, info in detection_report['detected_columns'].items():
-                            st.write(f"**{col_name}**: {info['type']} (confidence: {info['confidence']:.0%})")
+                        st.markdown("  \n".join(
+                            f"**{col_name}**: {info['type']} (confidence: {info['confidence']:.0%})"
+                            for col_name, info in detection_report['detected_columns'].items()
+                        ))
         
         if auto_clean_enabled:
             if st.button("✨ Apply Automatic Cleaning", type="primary"):
@@ -543,9 +716,7 @@ class DataTransformer:
                     st.session_state['amr_detection_report'] = detection_report
                     
                     # Track operation
-                    if 'operations_applied' not in st.session_state['transformation_state']:
-                        st.session_state['transformation_state']['operations_applied'] = []
-                    st.session_state['transformation_state']['operations_applied'].append(
+                    self._track_operation(
                         f"Automatic AMR cleaning ({len(detection_report['detected_columns'])} columns)"
                     )
                     
@@ -610,23 +781,21 @@ class DataTransformer:
         
         preview_button = st.button("Preview Number Extraction")
         if cols_to_extract and preview_button:
-            df_copy = df.copy()
-            extracted_data = {}
-            for col in cols_to_extract:
-                extracted_data[col] = self.transformations['text']['extract_numbers'](df_copy[col])
-            st.session_state['extracted_numbers'] = extracted_data
+            st.session_state['extracted_numbers'] = self._extract_numbers_batch(df, cols_to_extract)
             
         # Show preview if we have extracted data
         if st.session_state.get('extracted_numbers'):
             st.write("Preview of extracted numbers:")
-            preview_df = df.copy()
+            preview_df = df[cols_to_extract].head().copy()
             for col, data in st.session_state['extracted_numbers'].items():
                 if col in cols_to_extract:  # Only show currently selected columns
                     preview_df[col] = data
-            st.dataframe(preview_df[cols_to_extract].head())
+            st.dataframe(preview_df)
             
             if st.button("Apply Number Extraction"):
-                # Update the input dataframe with the extracted numbers
+                # Update the dataframe with the extracted numbers (a new frame, so
+                # the shared processed_data reference is never mutated in place)
+                df = df.copy(deep=False)
                 for col in cols_to_extract:
                     if col in st.session_state['extracted_numbers']:
                         df[col] = st.session_state['extracted_numbers'][col]
@@ -637,15 +806,12 @@ class DataTransformer:
                 st.success(f"Extracted numbers from {len(cols_to_extract)} column(s)")
                 
                 # Track operation
-                if 'operations_applied' not in st.session_state['transformation_state']:
-                    st.session_state['transformation_state']['operations_applied'] = []
-                st.session_state['transformation_state']['operations_applied'].append(
+                self._track_operation(
                     f"Number extraction from {len(cols_to_extract)} columns"
                 )
                 
                 # Show preview of updated data
                 st.write("##### Data Preview After Number Extraction:")
-                from .helpers import prepare_df_for_display
                 st.dataframe(prepare_df_for_display(df[cols_to_extract].head(3)), use_container_width=True)
                 
                 st.session_state['extracted_numbers'] = {}  # Clear the preview
@@ -658,8 +824,17 @@ class DataTransformer:
         
         # Show initial column analysis
         total_columns = len(df.columns)
-        empty_cols = df.columns[df.isna().all()].tolist()
-        non_empty_cols = [col for col in df.columns if col not in empty_cols]
+        cached_analysis = st.session_state.get('empty_column_analysis')
+        if cached_analysis is not None and _same_frame(cached_analysis['frame'], cached_analysis['frame_fp'], df):
+            analysis = cached_analysis['result']
+        else:
+            analysis = _empty_column_analysis(df)
+            st.session_state['empty_column_analysis'] = {
+                'frame': df,
+                'frame_fp': _frame_fingerprint(df),
+                'result': analysis
+            }
+        empty_cols, non_empty_cols, important_empty_cols = analysis
         
         st.write("##### Current Column Analysis")
         col1, col2, col3 = st.columns(3)
@@ -672,21 +847,17 @@ class DataTransformer:
             
         if empty_cols:
             st.write("##### Empty Columns Found:")
-            for col in empty_cols:
-                st.write(f"- `{col}`")
+            st.markdown(_column_bullets(empty_cols))
                 
         # Add warning if empty columns contain specific keywords
-        important_keywords = ['id', 'date', 'patient', 'specimen', 'result', 'test', 'lab', 'organism', 'antibiotic']
-        important_empty_cols = [col for col in empty_cols if any(keyword in col.lower() for keyword in important_keywords)]
         if important_empty_cols:
             st.warning("⚠️ The following empty columns might contain important data. Please verify before removing:", icon="⚠️")
-            for col in important_empty_cols:
-                st.write(f"- `{col}`")
+            st.markdown(_column_bullets(important_empty_cols))
         
         if st.button("Remove Columns with No Data"):
             if empty_cols:
-                # Store original state
-                original_df = df.copy()
+                # Keep a reference to the original state (drop returns a new frame)
+                original_df = df
                 
                 # Drop the empty columns
                 df = df.drop(columns=empty_cols)
@@ -695,9 +866,7 @@ class DataTransformer:
                 st.session_state['processed_data'] = df
                 
                 # Track operation
-                if 'operations_applied' not in st.session_state['transformation_state']:
-                    st.session_state['transformation_state']['operations_applied'] = []
-                st.session_state['transformation_state']['operations_applied'].append(
+                self._track_operation(
                     f"Removed {len(empty_cols)} empty columns"
                 )
                 
@@ -707,12 +876,10 @@ class DataTransformer:
                 # Show detailed report
                 st.success(f"✅ Column Removal Report:")
                 st.write("##### Columns Removed:")
-                for col in empty_cols:
-                    st.write(f"- `{col}`")
+                st.markdown(_column_bullets(empty_cols))
                     
                 st.write("##### Columns Kept:")
-                for col in non_empty_cols:
-                    st.write(f"- `{col}`")
+                st.markdown(_column_bullets(non_empty_cols))
                     
                 # Show metrics
                 col1, col2, col3 = st.columns(3)
@@ -738,8 +905,7 @@ class DataTransformer:
                     
                 # Show preview after removal
                 st.write("##### Data Preview After Empty Column Removal:")
-                from .helpers import prepare_df_for_display
-                st.dataframe(prepare_df_for_display(df.head(3)), use_container_width=True)
+                st.dataframe(display_head(df, 3), use_container_width=True)
             else:
                 st.info("No empty columns found")
                 
@@ -766,29 +932,27 @@ class DataTransformer:
             st.dataframe(preview_data)
             
             # Show warning for important columns
-            important_keywords = ['id', 'date', 'patient', 'specimen', 'result', 'test', 'lab', 'organism', 'antibiotic', 'name']
-            important_cols_to_delete = [col for col in columns_to_delete if any(keyword in col.lower() for keyword in important_keywords)]
+            important_cols_to_delete = _important_columns(columns_to_delete, _IMPORTANT_DELETE_RE)
             
             if important_cols_to_delete:
                 st.warning("⚠️ You're about to delete columns that might contain important data:")
-                for col in important_cols_to_delete:
-                    st.write(f"- `{col}`")
+                st.markdown(_column_bullets(important_cols_to_delete))
                     
             # Show what will remain
-            remaining_columns = [col for col in df.columns if col not in columns_to_delete]
+            delete_set = set(columns_to_delete)
+            remaining_columns = [col for col in df.columns if col not in delete_set]
             st.write(f"##### After deletion, {len(remaining_columns)} columns will remain:")
             
             with st.expander("Show remaining columns", expanded=False):
-                for col in remaining_columns:
-                    st.write(f"- `{col}`")
+                st.markdown(_column_bullets(remaining_columns))
             
             # Deletion controls
             col1, col2 = st.columns(2)
             
             with col1:
                 if st.button("🗑️ Delete Selected Columns", type="primary"):
-                    # Store original state for undo
-                    original_df_delete = df.copy()
+                    # Keep a reference to the original state for undo (drop returns a new frame)
+                    original_df_delete = df
                     
                     # Perform deletion
                     df = df.drop(columns=columns_to_delete)
@@ -802,9 +966,7 @@ class DataTransformer:
                     # Update successful - no debug message needed in production
                     
                     # Track operation
-                    if 'operations_applied' not in st.session_state['transformation_state']:
-                        st.session_state['transformation_state']['operations_applied'] = []
-                    st.session_state['transformation_state']['operations_applied'].append(
+                    self._track_operation(
                         f"Deleted {len(columns_to_delete)} columns: {', '.join(columns_to_delete)}"
                     )
                     
@@ -823,16 +985,18 @@ class DataTransformer:
                     
                     # List deleted columns
                     st.write("**Deleted Columns:**")
-                    for col in columns_to_delete:
-                        st.write(f"- `{col}`")
+                    st.markdown(_column_bullets(columns_to_delete))
                     
-                    # Store deletion history in session state for undo
+                    # Store deletion history in session state for undo: only the
+                    # deleted columns are retained, not a snapshot of the whole frame
                     if 'deletion_history' not in st.session_state:
                         st.session_state['deletion_history'] = []
                     st.session_state['deletion_history'].append({
                         'deleted_columns': columns_to_delete,
-                        'original_df': original_df_delete
+                        'columns_data': {col: original_df_delete[col] for col in columns_to_delete},
+                        'original_column_order': list(original_df_delete.columns)
                     })
+                    del st.session_state['deletion_history'][:-_MAX_DELETION_HISTORY]
                     
                     st.rerun()
             
@@ -841,7 +1005,7 @@ class DataTransformer:
                 if 'deletion_history' in st.session_state and st.session_state['deletion_history']:
                     if st.button("↶ Undo Last Deletion"):
                         last_deletion = st.session_state['deletion_history'].pop()
-                        df = last_deletion['original_df']
+                        df = self._restore_deleted_columns(df, last_deletion)
                         
                         # **CRITICAL FIX**: Update session state with the restored dataframe
                         st.session_state['processed_data'] = df
@@ -855,8 +1019,7 @@ class DataTransformer:
         # Show current data preview after column operations
         if len(df.columns) > 0:
             st.write("##### Current Data Preview (After Column Operations)")
-            from .helpers import prepare_df_for_display
-            st.dataframe(prepare_df_for_display(df.head(3)), use_container_width=True)
+            st.dataframe(display_head(df, 3), use_container_width=True)
             st.info(f"Current dataset: {len(df)} rows × {len(df.columns)} columns")
         
         st.write("---")
@@ -882,7 +1045,8 @@ class DataTransformer:
         # Create the final transformed dataframe that includes ALL previous changes
         # This includes: number extractions, column deletions, empty column removals, and age standardization
         # **CRITICAL FIX**: Use the updated session state data instead of local df
-        transformed_df = st.session_state['processed_data'].copy()
+        # (no copy needed: _apply_transformation returns a new frame each time)
+        transformed_df = st.session_state['processed_data']
         
         # Ensure that all columns referenced in transformations still exist after deletions
         valid_transformations = []
@@ -932,18 +1096,11 @@ class DataTransformer:
                 # **CRITICAL FIX**: Update session state with transformed data
                 st.session_state['processed_data'] = transformed_df
                 
-                # Track operation
-                if 'operations_applied' not in st.session_state['transformation_state']:
-                    st.session_state['transformation_state']['operations_applied'] = []
-                
-                # Check if this operation is already tracked
-                operation_desc = f"Applied {transform_type} to {column}"
-                if operation_desc not in st.session_state['transformation_state']['operations_applied']:
-                    st.session_state['transformation_state']['operations_applied'].append(operation_desc)
+                # Track operation (only once per distinct description)
+                self._track_operation(f"Applied {transform_type} to {column}", unique=True)
                 
                 # Show immediate preview of the transformation
                 st.write(f"##### Preview after {transform_type} on {column}:")
-                from .helpers import prepare_df_for_display
                 st.dataframe(prepare_df_for_display(transformed_df[[column]].head(3)), use_container_width=True)
             
             # Remove transformation button
@@ -958,10 +1115,10 @@ class DataTransformer:
         # Show operations applied
         if 'operations_applied' in st.session_state.get('transformation_state', {}):
             with st.expander("📋 Applied Operations", expanded=False):
-                for i, op in enumerate(st.session_state['transformation_state']['operations_applied'], 1):
-                    st.markdown(f"{i}. {op}")
-        
-        from .helpers import prepare_df_for_display
+                st.markdown("\n".join(
+                    f"{i}. {op}"
+                    for i, op in enumerate(st.session_state['transformation_state']['operations_applied'], 1)
+                ))
         
         # Show column comparison if deletions occurred
         original_cols = st.session_state['transformation_state']['original_columns']
@@ -973,35 +1130,29 @@ class DataTransformer:
             
             with col_a:
                 st.write("**Original Columns:**")
-                deleted_cols = [col for col in original_cols if col not in current_cols]
-                for col in original_cols:
-                    if col in deleted_cols:
-                        st.write(f"~~{col}~~ (deleted)")
-                    else:
-                        st.write(f"✓ {col}")
+                current_set = set(current_cols)
+                deleted_cols = {col for col in original_cols if col not in current_set}
+                st.markdown("  \n".join(
+                    f"~~{col}~~ (deleted)" if col in deleted_cols else f"✓ {col}"
+                    for col in original_cols
+                ))
             
             with col_b:
                 st.write("**Current Columns:**")
-                for col in current_cols:
-                    st.write(f"✓ {col}")
+                st.markdown("  \n".join(f"✓ {col}" for col in current_cols))
         
         # Show the actual data preview
-        st.dataframe(prepare_df_for_display(transformed_df.head(10)), use_container_width=True)
+        st.dataframe(display_head(transformed_df), use_container_width=True)
         
         # Add expandable full column view
         with st.expander("View All Columns", expanded=False):
-            col_info = []
-            for i, col in enumerate(transformed_df.columns):
-                dtype = str(transformed_df[col].dtype)
-                non_null = transformed_df[col].notna().sum()
-                col_info.append({
-                    'Column': col,
-                    'Data Type': dtype,
-                    'Non-Null Count': non_null,
-                    'Null Count': len(transformed_df) - non_null
-                })
-            
-            col_df = pd.DataFrame(col_info)
+            non_null = transformed_df.notna().sum().values
+            col_df = pd.DataFrame({
+                'Column': transformed_df.columns,
+                'Data Type': transformed_df.dtypes.astype(str).values,
+                'Non-Null Count': non_null,
+                'Null Count': len(transformed_df) - non_null
+            })
             st.dataframe(col_df, use_container_width=True)
         
         # Provide comprehensive summary of all applied transformations
@@ -1036,10 +1187,11 @@ class DataTransformer:
         
         with col3:
             st.write("**Data Types:**")
-            # Show data type summary
-            numeric_cols = len(transformed_df.select_dtypes(include=['number']).columns)
-            text_cols = len(transformed_df.select_dtypes(include=['object']).columns)
-            datetime_cols = len(transformed_df.select_dtypes(include=['datetime']).columns)
+            # Show data type summary from a single pass over the dtypes
+            dtype_counts = transformed_df.dtypes.map(_dtype_group).value_counts()
+            numeric_cols = int(dtype_counts.get('number', 0))
+            text_cols = int(dtype_counts.get('text', 0))
+            datetime_cols = int(dtype_counts.get('date', 0))
             st.metric("Numeric Columns", numeric_cols)
             st.metric("Text Columns", text_cols)
             st.metric("Date Columns", datetime_cols)
@@ -1051,6 +1203,78 @@ class DataTransformer:
         st.session_state['processed_data'] = transformed_df
         return transformed_df
     
+    def _extract_numbers_batch(self, df: pd.DataFrame, columns: List[str]) -> Dict[str, pd.Series]:
+        """
+        Extract numbers from several columns in a single regex pass.
+        
+        The selected columns are flattened into one series so the string
+        accessor and regex run once, then split back per column and converted
+        to numbers column by column so each keeps its own dtype.
+        
+        Args:
+            df: Input dataframe
+            columns: Columns to extract numbers from
+            
+        Returns:
+            Dictionary mapping each column to its extracted numeric series
+        """
+        # Take each selected name once; with duplicate headers the first
+        # column of that name is used
+        columns = list(dict.fromkeys(columns))
+        frame = df.loc[:, ~df.columns.duplicated()][columns]
+        values = frame.astype(str).to_numpy().ravel()
+        flat = _apply_text_transform(
+            pd.Series(values),
+            lambda x: _as_str(x).str.extract(_NUM_RE, expand=False)
+        )
+        extracted = flat.to_numpy(dtype=object).reshape(len(df), len(columns))
+        return {
+            col: pd.to_numeric(pd.Series(extracted[:, i], index=df.index, name=col), errors='coerce')
+            for i, col in enumerate(columns)
+        }
+    
+    def _restore_deleted_columns(self, df: pd.DataFrame, deletion: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Re-insert columns recorded in a deletion history entry.
+        
+        Args:
+            df: Current dataframe
+            deletion: Deletion history entry with the removed columns' data
+            
+        Returns:
+            Dataframe with the deleted columns restored in their original position
+        """
+        restored_cols = pd.DataFrame(deletion['columns_data']).reindex(df.index)
+        restored = pd.concat([df, restored_cols], axis=1)
+        
+        original_order = [col for col in deletion['original_column_order'] if col in restored.columns]
+        original_set = set(original_order)
+        new_cols = [col for col in restored.columns if col not in original_set]
+        return restored[original_order + new_cols]
+    
+    def _track_operation(self, operation_desc: str, unique: bool = False) -> None:
+        """
+        Record an applied operation in the transformation state.
+        
+        The ordered list is kept for display while a companion set gives
+        O(1) membership checks for operations that are re-applied on every rerun.
+        
+        Args:
+            operation_desc: Human-readable description of the operation
+            unique: Skip recording if the same description was already tracked
+        """
+        state = st.session_state['transformation_state']
+        ops_list = state.setdefault('operations_applied', [])
+        ops_set = state.get('operations_applied_set')
+        if ops_set is None:
+            ops_set = state['operations_applied_set'] = set(ops_list)
+        
+        if unique and operation_desc in ops_set:
+            return
+        
+        ops_list.append(operation_desc)
+        ops_set.add(operation_desc)
+    
     def _get_transformation_types(self, dtype) -> List[str]:
         """
         Get appropriate transformation types for a column's data type.
@@ -1061,12 +1285,7 @@ class DataTransformer:
         Returns:
             List of applicable transformations
         """
-        if pd.api.types.is_numeric_dtype(dtype):
-            return list(self.transformations['number'].keys())
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            return list(self.transformations['date'].keys())
-        else:
-            return list(self.transformations['text'].keys())
+        return self._types_by_kind.get(getattr(dtype, 'kind', 'O'), self._text_types)
     
     def _get_transformation_params(self, transform_type: str, index: int) -> Dict[str, Any]:
         """
@@ -1111,27 +1330,63 @@ class DataTransformer:
         Returns:
             Transformed dataframe
         """
-        transformed_df = df.copy()
-        
         try:
-            if pd.api.types.is_numeric_dtype(df[column].dtype):
-                transform_func = self.transformations['number'][transform_type]
+            series = df[column]
+            params_key = ()
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                category = 'number'
                 if transform_type == 'round':
-                    transformed_df[column] = transform_func(df[column], params['decimals'])
-                else:
-                    transformed_df[column] = transform_func(df[column])
-            
-            elif pd.api.types.is_datetime64_any_dtype(df[column].dtype):
-                transform_func = self.transformations['date'][transform_type]
-                transformed_df[column] = transform_func(df[column])
+                    params_key = (params['decimals'],)
+            elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+                category = 'date'
+            else:
+                category = 'text'
+            
+            # Reuse the previous rerun's result when the input column is unchanged.
+            # This avoids even the cache_data round-trip, which unpickles a copy.
+            # The same frame object flowing back in is detected in constant time;
+            # otherwise the column's content fingerprint decides.
+            results = st.session_state.setdefault('transformation_results', {})
+            result_key = (column, transform_type, params_key)
+            cached = results.get(result_key)
+            if cached is not None and _same_frame(cached['frame'], cached['frame_fp'], df):
+                series_key = cached['series_key']
+            else:
+                series_key = _series_fingerprint(series)
             
+            if cached is not None and cached['series_key'] == series_key:
+                result = cached['result']
             else:
-                transform_func = self.transformations['text'][transform_type]
-                transformed_df[column] = transform_func(df[column].astype(str))
+                transform_func = self.transformations[category][transform_type]
+                result = _compute_transform(
+                    series_key,
+                    category,
+                    transform_type,
+                    params_key,
+                    series,
+                    transform_func
+                )
+            # Re-insert as the newest entry, then keep one entry per active
+            # transformation so the session never accumulates stale frames
+            results.pop(result_key, None)
+            results[result_key] = {
+                'frame': df,
+                'frame_fp': _frame_fingerprint(df),
+                'series_key': series_key,
+                'result': result
+            }
+            max_entries = max(1, len(st.session_state.get('transformations', [])))
+            for stale_key in list(results)[:-max_entries]:
+                del results[stale_key]
+            
+            # Shallow copy: only the transformed column is replaced, the
+            # remaining columns keep sharing their data with the input frame
+            transformed_df = df.copy(deep=False)
+            transformed_df[column] = result
             
             st.success(f"Applied {transform_type} transformation to {column}")
+            return transformed_df
             
         except Exception as e:
             st.error(f"Error applying transformation: {str(e)}")
-        
-        return transformed_df
+            return df
@@ -3,8 +3,46 @@ Enhanced UI components for improved user experience
 """
 
 import streamlit as st
+from itertools import cycle
+from types import MappingProxyType
 from typing import List, Dict, Optional, Any
-import time
+
+# Read-only icon lookups shared by every render instead of rebuilt per call
+_BANNER_ICONS = MappingProxyType({
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌"
+})
+
+_STATUS_ICONS = MappingProxyType({
+    "success": "✅",
+    "error": "❌",
+    "warning": "⚠️",
+    "info": "ℹ️",
+    "pending": "⏳"
+})
+
+# Workflow card fragments
+_CARD_BADGE_RECOMMENDED = (
+    "<span style='display:inline-block;background:linear-gradient(135deg,#667eea,#764ba2);"
+    "color:white;padding:0.2rem 0.6rem;border-radius:20px;font-size:0.75rem;"
+    "font-weight:600;margin-bottom:0.5rem'>⭐ Recommended</span>"
+)
+_CARD_BADGE_PLACEHOLDER = "<span style='visibility:hidden;display:block;line-height:1.8;font-size:0.75rem'>⭐</span>"
+_CARD_TEMPLATE = (
+    "{badge}\n\n"
+    "### {icon} {title}\n\n"
+    "<p style='color:rgba(49,51,63,0.6);font-size:0.875rem'>{description}</p>\n\n"
+    "{features}\n\n"
+    "---"
+)
+
+# Step indicator badges, composed once; only the icon and title vary per step
+_BADGE_BASE = "padding:0.25rem 0.5rem;border-radius:6px;font-weight:600"
+_BADGE_DONE = "<span style='background:#e6fffa;color:#047857;" + _BADGE_BASE + "'>{} {}</span>"
+_BADGE_CURRENT = "<span style='background:linear-gradient(135deg,#667eea,#764ba2);color:white;" + _BADGE_BASE + "'>{} {}</span>"
+_BADGE_PENDING = "<span style='background:#f1f5f9;color:#64748b;" + _BADGE_BASE + "'>{} {}</span>"
 
 
 class UIComponents:
@@ -28,14 +66,9 @@ class UIComponents:
         with st.container():
             # Recommended badge or invisible placeholder - keeps card heights uniform
             if recommended:
-                st.markdown(
-                    "<span style='display:inline-block;background:linear-gradient(135deg,#667eea,#764ba2);"
-                    "color:white;padding:0.2rem 0.6rem;border-radius:20px;font-size:0.75rem;"
-                    "font-weight:600;margin-bottom:0.5rem'>⭐ Recommended</span>",
-                    unsafe_allow_html=True
-                )
+                st.markdown(_CARD_BADGE_RECOMMENDED, unsafe_allow_html=True)
             else:
-                st.markdown("<span style='visibility:hidden;display:block;line-height:1.8;font-size:0.75rem'>⭐</span>", unsafe_allow_html=True)
+                st.markdown(_CARD_BADGE_PLACEHOLDER, unsafe_allow_html=True)
             
             # Icon and title - clear hierarchy
             st.markdown(f"### {icon} {title}")
@@ -44,10 +77,8 @@ class UIComponents:
             st.caption(description)
             st.markdown("")
             
-            # Features list - easy to scan with checkmarks
-            st.markdown("**Features:**")
-            for feature in features:
-                st.markdown(f"• {feature}")
+            # Features list - easy to scan with checkmarks (one element for the whole list)
+            st.markdown("  \n".join(["**Features:**"] + [f"• {feature}" for feature in features]))
             
             st.markdown("---")
             
@@ -57,6 +88,40 @@ class UIComponents:
                 return True
         return False
     
+    @staticmethod
+    def render_workflow_cards(cards: List[Dict[str, Any]], ncols: int = 3) -> Optional[str]:
+        """
+        Render several workflow cards in a column layout.
+        
+        Each card's badge, title, description and features are sent as a single
+        markdown element, with only the action button rendered separately.
+        
+        Args:
+            cards: Card definitions using the same keys as workflow_card's arguments
+            ncols: Number of columns to lay the cards out in
+            
+        Returns:
+            The button_key of the clicked card, or None if no card was clicked
+        """
+        clicked = None
+        for card, col in zip(cards, cycle(st.columns(ncols))):
+            recommended = card.get('recommended', False)
+            with col:
+                st.markdown(
+                    _CARD_TEMPLATE.format(
+                        badge=_CARD_BADGE_RECOMMENDED if recommended else _CARD_BADGE_PLACEHOLDER,
+                        icon=card['icon'],
+                        title=card['title'],
+                        description=card['description'],
+                        features="  \n".join(["**Features:**"] + [f"• {feature}" for feature in card['features']])
+                    ),
+                    unsafe_allow_html=True
+                )
+                if st.button(card['button_label'], key=card['button_key'], use_container_width=True,
+                             type="primary" if recommended else "secondary"):
+                    clicked = card['button_key']
+        return clicked
+    
     @staticmethod
     def step_indicator(steps: List[Dict[str, Any]], current_step: int, 
                       completed_steps: Optional[List[int]] = None):
@@ -71,29 +136,24 @@ class UIComponents:
         if completed_steps is None:
             completed_steps = list(range(current_step))
         
+        completed = set(completed_steps)
+        
         # Create columns for steps
         cols = st.columns(len(steps))
         
-        for i, step in enumerate(steps):
-            with cols[i]:
-                icon = step.get('icon', '')
+        for i, (col, step) in enumerate(zip(cols, steps)):
+            with col:
                 title = step.get('title', f'Step {i + 1}')
                 
                 # Determine status and styling
-                if i in completed_steps:
-                    status_icon = "✅"
-                    badge_style = "background:#e6fffa;color:#047857;padding:0.25rem 0.5rem;border-radius:6px;font-weight:600"
+                if i in completed:
+                    badge = _BADGE_DONE.format("✅", title)
                 elif i == current_step:
-                    status_icon = icon if icon else "⏳"
-                    badge_style = "background:linear-gradient(135deg,#667eea,#764ba2);color:white;padding:0.25rem 0.5rem;border-radius:6px;font-weight:600"
+                    badge = _BADGE_CURRENT.format(step.get('icon') or "⏳", title)
                 else:
-                    status_icon = str(i + 1)
-                    badge_style = "background:#f1f5f9;color:#64748b;padding:0.25rem 0.5rem;border-radius:6px;font-weight:600"
+                    badge = _BADGE_PENDING.format(i + 1, title)
                 
-                st.markdown(
-                    f"<span style='{badge_style}'>{status_icon} {title}</span>",
-                    unsafe_allow_html=True
-                )
+                st.markdown(badge, unsafe_allow_html=True)
     
     @staticmethod
     def info_banner(message: str, type: str = "info", icon: Optional[str] = None, 
@@ -107,15 +167,7 @@ class UIComponents:
             icon: Optional icon emoji
             dismissible: Whether banner can be dismissed (not implemented)
         """
-        type_config = {
-            "info": {"icon": "ℹ️"},
-            "success": {"icon": "✅"},
-            "warning": {"icon": "⚠️"},
-            "error": {"icon": "❌"}
-        }
-        
-        config = type_config.get(type, type_config["info"])
-        display_icon = icon or config["icon"]
+        display_icon = icon or _BANNER_ICONS.get(type, _BANNER_ICONS["info"])
         
         # Use Streamlit's native components
         if type == "success":
@@ -195,15 +247,7 @@ class UIComponents:
             status: Status text
             size: Badge size (small, medium, large) - not used, kept for compatibility
         """
-        status_icons = {
-            "success": "✅",
-            "error": "❌",
-            "warning": "⚠️",
-            "info": "ℹ️",
-            "pending": "⏳"
-        }
-        
-        icon = status_icons.get(status.lower(), "⭕")
+        icon = _STATUS_ICONS.get(status.lower(), "⭕")
         st.markdown(f"**{icon} {status.title()}**")
 
 # Global UI components instance
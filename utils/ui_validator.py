@@ -4,8 +4,244 @@ Ensures user-friendly interfaces and workflows following best practices
 """
 
 import streamlit as st
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only needed for annotations; the validators work on dataframes they are
+    # handed, so pandas is not imported when this module loads
+    import pandas as pd
+
+# Read-only icon lookup shared by every render instead of rebuilt per call
+_OP_ICONS = MappingProxyType({
+    'success': '✅',
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️',
+    'processing': '⏳'
+})
+
+# Accessibility stylesheet, built once at import time
+_A11Y_CSS = """
+<style>
+/* Accessibility improvements */
+.stButton > button {
+    min-height: 2.5rem;
+    font-size: 1rem;
+}
+
+.stTextInput > label,
+.stSelectbox > label,
+.stFileUploader > label {
+    font-weight: 600;
+    margin-bottom: 0.5rem;
+}
+
+/* High contrast for important elements */
+.stAlert {
+    border-left: 4px solid;
+}
+
+/* Focus indicators */
+.stButton > button:focus,
+.stTextInput > div > input:focus {
+    outline: 2px solid #0066cc;
+    outline-offset: 2px;
+}
+</style>
+"""
+
+# Workflow guides shown by show_workflow_guidance
+_GUIDE_SINGLE = """
+**Single File Workflow Guide:**
+1. **Upload**: Select your data file (CSV or Excel)
+2. **Map** (Optional): Rename columns to standard names
+3. **Transform**: Clean and standardize data values
+4. **Validate**: Check data quality and completeness
+5. **Export**: Download processed data
+
+**Tips:**
+- Start with a small sample file to test the workflow
+- Review data quality assessment before exporting
+- Use auto-fix options to improve data quality automatically
+"""
+
+_GUIDE_MULTIPLE = """
+**Multiple Files Workflow Guide:**
+1. **Upload**: Select multiple files to merge
+2. **Merge**: Files are automatically combined with smart column matching
+3. **Transform**: Clean and standardize merged data
+4. **Validate**: Check merged data quality
+5. **Export**: Download unified dataset
+
+**Tips:**
+- Files should have similar structure for best results
+- Column names will be automatically matched
+- Review merge statistics to ensure correct combination
+"""
+
+_GUIDE_GLASS = """
+**GLASS Preparation Wizard Guide:**
+This wizard guides you through preparing AMR data for GLASS submission.
+
+**What to expect:**
+- Automatic data cleaning and standardization
+- GLASS format validation
+- Quality assessment and recommendations
+- Ready-to-submit data export
+
+**Requirements:**
+- Organism names
+- Specimen types
+- Specimen dates
+- Patient age and gender
+- Antimicrobial susceptibility results
+"""
+
+_GUIDE_WHONET = """
+**WHONET Preparation Wizard Guide:**
+This wizard prepares your AMR data for WHONET import.
+
+**What to expect:**
+- Automatic format conversion
+- WHONET-compatible standardization
+- Quality validation
+- Import-ready data export
+
+**Requirements:**
+- Organism identification
+- Antimicrobial test results
+- Patient/specimen information
+"""
+
+_WORKFLOW_GUIDANCE = MappingProxyType({
+    'single': _GUIDE_SINGLE,
+    'multiple': _GUIDE_MULTIPLE,
+    'glass': _GUIDE_GLASS,
+    'whonet': _GUIDE_WHONET
+})
+
+# Row count above which the duplicate-row check is skipped during upload validation
+_DUPLICATE_CHECK_MAX_ROWS = 200_000
+
+
+def _frame_digest(df: "pd.DataFrame") -> bytes:
+    """Full-content cache key for dataframes, shared with the validator module."""
+    from .validator import _frame_digest as digest
+    return digest(df)
+
+
+# Keyed by type name so pandas is still not imported when this module loads;
+# pandas 3 reports DataFrame under the top-level package, earlier versions do not
+_FRAME_HASH_FUNCS = {
+    'pandas.DataFrame': _frame_digest,
+    'pandas.core.frame.DataFrame': _frame_digest
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs=_FRAME_HASH_FUNCS)
+def _missing_percentage(df: "pd.DataFrame") -> float:
+    """Percentage of missing cells, from one boolean array and one reduction; cached per dataframe."""
+    if df.size == 0:
+        return 0.0
+    return (int(df.isna().to_numpy().sum()) / df.size) * 100
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _validate_file_metadata(name: str, size_bytes: int, file_type: str,
+                            max_size_mb: float) -> Dict[str, Any]:
+    """Validate an upload from its metadata; cached so reruns do not repeat the checks."""
+    result = {
+        'valid': True,
+        'errors': [],
+        'warnings': [],
+        'file_info': {}
+    }
+    
+    # Check file size
+    file_size_mb = size_bytes / (1024 * 1024)
+    result['file_info'] = {
+        'name': name,
+        'size_mb': round(file_size_mb, 2),
+        'type': file_type
+    }
+    
+    if file_size_mb > max_size_mb:
+        result['valid'] = False
+        result['errors'].append(
+            f"File size ({file_size_mb:.1f} MB) exceeds maximum allowed size ({max_size_mb} MB). "
+            f"Please split your data into smaller files or contact support for assistance."
+        )
+    
+    # Check file type
+    allowed_types = ['text/csv', 'application/vnd.ms-excel', 
+                    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet']
+    if file_type not in allowed_types:
+        result['warnings'].append(
+            f"File type '{file_type}' may not be supported. "
+            f"Please use CSV or Excel (.xlsx, .xls) files for best results."
+        )
+    
+    return result
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs=_FRAME_HASH_FUNCS)
+def _validate_dataframe(df: "pd.DataFrame") -> Dict[str, Any]:
+    """
+    Validate a dataframe before processing.
+    
+    Cached on the full-content dataframe digest, so the null and duplicate
+    scans run once per distinct upload and never reuse another frame's result.
+    """
+    result = {
+        'valid': True,
+        'errors': [],
+        'warnings': [],
+        'suggestions': []
+    }
+    
+    # Check for minimum rows
+    if len(df) < 1:
+        result['valid'] = False
+        result['errors'].append(
+            "Data file must contain at least one row of data."
+        )
+    
+    # Check for minimum columns
+    if len(df.columns) < 1:
+        result['valid'] = False
+        result['errors'].append(
+            "Data file must contain at least one column."
+        )
+    
+    # Check for excessive missing data
+    missing_pct = _missing_percentage(df)
+    if missing_pct > 50:
+        result['warnings'].append(
+            f"High percentage of missing data ({missing_pct:.1f}%). "
+            "Consider reviewing your data source or using data imputation."
+        )
+    
+    # Check for duplicate rows; hashing every row is skipped on very large uploads
+    duplicate_count = int(df.duplicated().sum()) if len(df) <= _DUPLICATE_CHECK_MAX_ROWS else None
+    if duplicate_count:
+        result['warnings'].append(
+            f"Found {duplicate_count} duplicate rows. "
+            "Consider removing duplicates before processing."
+        )
+    
+    # Column-name heuristics share one set and one lowercasing pass
+    cols = set(df.columns)
+    cols_lower = {str(col).lower() for col in cols}
+    
+    # Suggestions
+    if 'Organism' not in cols and any('organism' in col for col in cols_lower):
+        result['suggestions'].append(
+            "Found potential organism column. Consider mapping it to 'Organism' for AMR analysis."
+        )
+    
+    return result
+
 
 class UIValidator:
     """
@@ -37,55 +273,26 @@ class UIValidator:
         Returns:
             Dict with 'valid', 'errors', 'warnings', 'file_info'
         """
-        result = {
-            'valid': True,
-            'errors': [],
-            'warnings': [],
-            'file_info': {}
-        }
-        
         if file is None:
-            return result
-        
-        # Check file size
-        file_size_mb = len(file.getvalue()) / (1024 * 1024)
-        result['file_info'] = {
-            'name': file.name,
-            'size_mb': round(file_size_mb, 2),
-            'type': file.type
-        }
+            return {
+                'valid': True,
+                'errors': [],
+                'warnings': [],
+                'file_info': {}
+            }
         
-        if file_size_mb > max_size_mb:
-            result['valid'] = False
-            result['errors'].append(
-                f"File size ({file_size_mb:.1f} MB) exceeds maximum allowed size ({max_size_mb} MB). "
-                f"Please split your data into smaller files or contact support for assistance."
-            )
-        
-        # Check file type
-        allowed_types = ['text/csv', 'application/vnd.ms-excel', 
-                        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet']
-        if file.type not in allowed_types:
-            result['warnings'].append(
-                f"File type '{file.type}' may not be supported. "
-                f"Please use CSV or Excel (.xlsx, .xls) files for best results."
-            )
-        
-        return result
+        # Validation only depends on file metadata; prefer the uploader's size
+        # attribute over materializing the whole buffer with getvalue()
+        size_bytes = getattr(file, 'size', None)
+        if size_bytes is None:
+            size_bytes = len(file.getvalue())
+        return _validate_file_metadata(file.name, size_bytes, file.type, max_size_mb)
     
     @staticmethod
     def show_operation_feedback(operation: str, status: str, message: str, 
                                details: Optional[str] = None, duration: int = 3):
         """Show operation feedback with appropriate styling"""
-        icons = {
-            'success': '✅',
-            'error': '❌',
-            'warning': '⚠️',
-            'info': 'ℹ️',
-            'processing': '⏳'
-        }
-        
-        icon = icons.get(status, 'ℹ️')
+        icon = _OP_ICONS.get(status, 'ℹ️')
         
         if status == 'success':
             st.success(f"{icon} **{operation}**: {message}")
@@ -106,7 +313,7 @@ class UIValidator:
             st.caption(details)
     
     @staticmethod
-    def show_data_preview_with_guidance(df: pd.DataFrame, title: str = "Data Preview"):
+    def show_data_preview_with_guidance(df: "pd.DataFrame", title: str = "Data Preview"):
         """Show data preview with helpful guidance"""
         st.markdown(f"### {title}")
         
@@ -128,88 +335,37 @@ class UIValidator:
         with col2:
             st.metric("Total Columns", len(df.columns))
         with col3:
-            missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
+            missing_pct = _missing_percentage(df)
             st.metric("Missing Data", f"{missing_pct:.1f}%")
     
     @staticmethod
     def confirm_action(message: str, action_label: str = "Confirm", 
-                      cancel_label: str = "Cancel") -> bool:
-        """Show confirmation dialog for critical actions"""
+                      cancel_label: str = "Cancel", *, key: Optional[str] = None) -> Optional[bool]:
+        """
+        Show confirmation dialog for critical actions
+        
+        Args:
+            key: Widget key prefix; defaults to one derived from the message
+        
+        Returns:
+            True if confirmed, False if cancelled, None if neither was clicked
+        """
+        if key is None:
+            key = f"confirm_{message}"
         col1, col2 = st.columns([3, 1])
         with col1:
             st.warning(message)
         with col2:
-            if st.button(action_label, type="primary", use_container_width=True):
+            if st.button(action_label, key=f"{key}_ok", type="primary", use_container_width=True):
                 return True
-            if st.button(cancel_label, use_container_width=True):
+            if st.button(cancel_label, key=f"{key}_cancel", use_container_width=True):
                 return False
-        return False
+        return None
     
     @staticmethod
     def show_workflow_guidance(workflow_type: str):
         """Show contextual guidance for current workflow"""
-        guidance = {
-            'single': """
-            **Single File Workflow Guide:**
-            1. **Upload**: Select your data file (CSV or Excel)
-            2. **Map** (Optional): Rename columns to standard names
-            3. **Transform**: Clean and standardize data values
-            4. **Validate**: Check data quality and completeness
-            5. **Export**: Download processed data
-            
-            **Tips:**
-            - Start with a small sample file to test the workflow
-            - Review data quality assessment before exporting
-            - Use auto-fix options to improve data quality automatically
-            """,
-            'multiple': """
-            **Multiple Files Workflow Guide:**
-            1. **Upload**: Select multiple files to merge
-            2. **Merge**: Files are automatically combined with smart column matching
-            3. **Transform**: Clean and standardize merged data
-            4. **Validate**: Check merged data quality
-            5. **Export**: Download unified dataset
-            
-            **Tips:**
-            - Files should have similar structure for best results
-            - Column names will be automatically matched
-            - Review merge statistics to ensure correct combination
-            """,
-            'glass': """
-            **GLASS Preparation Wizard Guide:**
-            This wizard guides you through preparing AMR data for GLASS submission.
-            
-            **What to expect:**
-            - Automatic data cleaning and standardization
-            - GLASS format validation
-            - Quality assessment and recommendations
-            - Ready-to-submit data export
-            
-            **Requirements:**
-            - Organism names
-            - Specimen types
-            - Specimen dates
-            - Patient age and gender
-            - Antimicrobial susceptibility results
-            """,
-            'whonet': """
-            **WHONET Preparation Wizard Guide:**
-            This wizard prepares your AMR data for WHONET import.
-            
-            **What to expect:**
-            - Automatic format conversion
-            - WHONET-compatible standardization
-            - Quality validation
-            - Import-ready data export
-            
-            **Requirements:**
-            - Organism identification
-            - Antimicrobial test results
-            - Patient/specimen information
-            """
-        }
-        
-        help_text = guidance.get(workflow_type, "Workflow guidance not available.")
+        help_text = _WORKFLOW_GUIDANCE.get(workflow_type, "Workflow guidance not available.")
         
         with st.expander("📖 Workflow Guide", expanded=False):
             st.markdown(help_text)
@@ -217,37 +373,10 @@ class UIValidator:
     @staticmethod
     def show_accessible_labels():
         """Add accessibility improvements"""
-        st.markdown("""
-        <style>
-        /* Accessibility improvements */
-        .stButton > button {
-            min-height: 2.5rem;
-            font-size: 1rem;
-        }
-        
-        .stTextInput > label,
-        .stSelectbox > label,
-        .stFileUploader > label {
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }
-        
-        /* High contrast for important elements */
-        .stAlert {
-            border-left: 4px solid;
-        }
-        
-        /* Focus indicators */
-        .stButton > button:focus,
-        .stTextInput > div > input:focus {
-            outline: 2px solid #0066cc;
-            outline-offset: 2px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_A11Y_CSS, unsafe_allow_html=True)
     
     @staticmethod
-    def validate_dataframe_for_processing(df: pd.DataFrame) -> Dict[str, Any]:
+    def validate_dataframe_for_processing(df: "pd.DataFrame") -> Dict[str, Any]:
         """Validate dataframe before processing with user-friendly messages"""
         result = {
             'valid': True,
@@ -263,43 +392,7 @@ class UIValidator:
             )
             return result
         
-        # Check for minimum rows
-        if len(df) < 1:
-            result['valid'] = False
-            result['errors'].append(
-                "Data file must contain at least one row of data."
-            )
-        
-        # Check for minimum columns
-        if len(df.columns) < 1:
-            result['valid'] = False
-            result['errors'].append(
-                "Data file must contain at least one column."
-            )
-        
-        # Check for excessive missing data
-        missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
-        if missing_pct > 50:
-            result['warnings'].append(
-                f"High percentage of missing data ({missing_pct:.1f}%). "
-                "Consider reviewing your data source or using data imputation."
-            )
-        
-        # Check for duplicate rows
-        duplicate_count = df.duplicated().sum()
-        if duplicate_count > 0:
-            result['warnings'].append(
-                f"Found {duplicate_count} duplicate rows. "
-                "Consider removing duplicates before processing."
-            )
-        
-        # Suggestions
-        if 'Organism' not in df.columns and any('organism' in col.lower() for col in df.columns):
-            result['suggestions'].append(
-                "Found potential organism column. Consider mapping it to 'Organism' for AMR analysis."
-            )
-        
-        return result
+        return _validate_dataframe(df)
 
 # Global UI validator instance
 ui_validator = UIValidator()
@@ -4,45 +4,63 @@ Enhanced user feedback and notification system
 
 import streamlit as st
 import time
-from typing import Optional, Dict, Any, List
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Notifications kept per session; older ones are evicted first
+_MAX_NOTIFICATIONS = 100
+
+class Notification(NamedTuple):
+    """A notification shown to the user"""
+    id: str
+    title: str
+    message: str
+    type: str
+    timestamp: datetime
+    duration: int
+    persistent: bool
+
 class UserFeedback:
     """
     Enhanced user feedback and notification system
     """
     
     def __init__(self):
-        self.notifications = []
+        self.notifications = deque(maxlen=_MAX_NOTIFICATIONS)
         self.progress_tasks = {}
     
+    @staticmethod
+    def _show_message(render, message: str, duration: int):
+        """
+        Render a success or info message without blocking the script thread.
+        
+        Messages with a positive duration are shown as toasts, which the
+        browser dismisses on its own; the rest are rendered inline with
+        the given Streamlit element. Warnings and errors do not go through
+        here; callers render them inline so they stay next to the step that
+        raised them.
+        """
+        if duration > 0:
+            st.toast(message)
+        else:
+            render(message)
+    
     def show_success(self, message: str, duration: int = 3, icon: str = "✅"):
         """Show success message with auto-dismiss"""
-        st.success(f"{icon} {message}")
-        
-        # Auto-dismiss after duration
-        if duration > 0:
-            time.sleep(duration)
-            st.empty()
+        self._show_message(st.success, f"{icon} {message}", duration)
     
     def show_info(self, message: str, duration: int = 5, icon: str = "ℹ️"):
         """Show info message with auto-dismiss"""
-        st.info(f"{icon} {message}")
-        
-        if duration > 0:
-            time.sleep(duration)
-            st.empty()
+        self._show_message(st.info, f"{icon} {message}", duration)
     
     def show_warning(self, message: str, duration: int = 7, icon: str = "⚠️"):
-        """Show warning message with auto-dismiss"""
+        """Show warning message inline"""
         st.warning(f"{icon} {message}")
-        
-        if duration > 0:
-            time.sleep(duration)
-            st.empty()
     
     def show_error(self, message: str, error_id: str = None, duration: int = 0, icon: str = "❌"):
         """Show error message with optional error ID"""
@@ -51,10 +69,6 @@ class UserFeedback:
             error_msg += f"\n\n**Error ID:** `{error_id}`"
         
         st.error(error_msg)
-        
-        if duration > 0:
-            time.sleep(duration)
-            st.empty()
     
     def show_progress_bar(self, task_id: str, message: str = "Processing..."):
         """Show progress bar for long-running tasks"""
@@ -86,40 +100,35 @@ class UserFeedback:
         
         st.success(f"✅ {message}")
     
+    @contextmanager
     def show_loading_spinner(self, message: str = "Loading..."):
-        """Show loading spinner"""
+        """Show a loading spinner for the duration of the wrapped block"""
         with st.spinner(message):
-            pass
+            yield
     
     def show_notification(self, title: str, message: str, type: str = "info", 
                          duration: int = 5, persistent: bool = False):
         """Show notification with title and message"""
-        notification = {
-            'id': f"notif_{int(time.time())}",
-            'title': title,
-            'message': message,
-            'type': type,
-            'timestamp': datetime.now(),
-            'duration': duration,
-            'persistent': persistent
-        }
-        
-        self.notifications.append(notification)
-        
-        # Display notification
-        if type == "success":
-            st.success(f"**{title}**\n\n{message}")
-        elif type == "error":
-            st.error(f"**{title}**\n\n{message}")
+        self.notifications.append(Notification(
+            id=f"notif_{int(time.time())}",
+            title=title,
+            message=message,
+            type=type,
+            timestamp=datetime.now(),
+            duration=duration,
+            persistent=persistent
+        ))
+        
+        # Display notification; errors and warnings stay inline, the rest
+        # auto-dismiss unless persistent
+        text = f"**{title}**\n\n{message}"
+        if type == "error":
+            st.error(text)
         elif type == "warning":
-            st.warning(f"**{title}**\n\n{message}")
+            st.warning(text)
         else:
-            st.info(f"**{title}**\n\n{message}")
-        
-        # Auto-dismiss if not persistent
-        if not persistent and duration > 0:
-            time.sleep(duration)
-            st.empty()
+            render = st.success if type == "success" else st.info
+            self._show_message(render, text, 0 if persistent else duration)
     
     def show_data_summary(self, df, title: str = "Data Summary"):
         """Show comprehensive data summary"""
@@ -193,6 +202,7 @@ class UserFeedback:
         """Show workflow guide with current step highlighted"""
         st.markdown("### 📋 Workflow Guide")
         
+        step_blocks = []
         for i, step in enumerate(steps):
             status_icon = "✅" if i < current_step else "⏳" if i == current_step else "⭕"
             status_color = "#28a745" if i < current_step else "#007bff" if i == current_step else "#6c757d"
@@ -202,13 +212,16 @@ class UserFeedback:
             text_color = "#ffffff" if background_color == "#000000" else "#000000"
             desc_color = "#cccccc" if background_color == "#000000" else "#666"
             
-            st.markdown(f"""
+            step_blocks.append(f"""
             <div style="padding: 10px; margin: 5px 0; border-left: 4px solid {status_color}; 
                         background: {step_bg}; color: {text_color};">
                 <strong>{status_icon} Step {i+1}: {step['title']}</strong><br>
                 <span style="color: {desc_color}; font-size: 0.9em;">{step['description']}</span>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        # All steps go out as a single element
+        st.markdown("".join(step_blocks), unsafe_allow_html=True)
     
     def clear_all_notifications(self):
         """Clear all notifications"""
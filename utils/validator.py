@@ -3,11 +3,76 @@ Validator Module
 Handles data validation and quality checks.
 """
 
+import hashlib
+import re
 import streamlit as st
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional
 
+def _format_issue(issue: Dict[str, Any]) -> str:
+    """Format one validation error or warning as a markdown list item."""
+    details = []
+    if 'type' in issue:
+        details.append(f"Type: {issue['type']}")
+    if 'rows' in issue:
+        details.append(f"Affected rows: {len(issue['rows'])}")
+    item = f"- {issue.get('message', '')}"
+    if details:
+        item += f" ({', '.join(details)})"
+    return item
+
+def _frame_digest(df: pd.DataFrame) -> bytes:
+    """
+    Full-content digest of a dataframe, used as the validation cache key.
+    
+    Streamlit's default hashing samples large frames, so two frames that
+    differ outside the sample would share cached results.
+    """
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).values.tobytes(), digest_size=16)
+    digest.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    return digest.digest()
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={pd.DataFrame: _frame_digest})
+def _validate_data(df: pd.DataFrame, validation_rules: Dict[str, Dict[str, Any]],
+                   _validator: "DataValidator") -> Dict[str, Any]:
+    """Run the column checks for a dataframe; cached on the data and the rules."""
+    results = {
+        'summary': {'total_errors': 0, 'total_warnings': 0},
+        'errors': [],
+        'warnings': [],
+        'column_stats': {}
+    }
+    
+    # Import column utilities for case-insensitive matching
+    from .column_utils import find_column_case_insensitive
+    
+    # One reference time for every date rule in this run
+    now = pd.Timestamp.now()
+    
+    # Validate each column (using case-insensitive matching)
+    for column, rules in validation_rules.items():
+        # Find column using case-insensitive matching
+        actual_column = find_column_case_insensitive(df, column)
+        
+        if actual_column is None:
+            if rules.get('required', False):
+                results['errors'].append({
+                    'type': 'missing_column',
+                    'column': column,
+                    'message': f"Required column '{column}' is missing (case-insensitive search)"
+                })
+            continue
+        
+        column_results = _validator._validate_column(df[actual_column], rules, now)
+        results['summary']['total_errors'] += len(column_results['errors'])
+        results['summary']['total_warnings'] += len(column_results['warnings'])
+        results['errors'].extend(column_results['errors'])
+        results['warnings'].extend(column_results['warnings'])
+        results['column_stats'][column] = column_results['stats']
+    
+    return results
+
 class DataValidator:
     """Handles data validation operations."""
     
@@ -17,7 +82,7 @@ class DataValidator:
             'Patient_ID': {
                 'required': True,
                 'unique': True,
-                'format': r'^[A-Z0-9-]+$',
+                'format': re.compile(r'^[A-Z0-9-]+$'),
                 'min_length': 5
             },
             'Age': {
@@ -49,62 +114,40 @@ class DataValidator:
         """
         Validate dataframe against defined rules.
         
+        Results are cached per dataframe content and rule set, so
+        re-running validation on unchanged data returns immediately.
+        
         Args:
             df: Input dataframe
             
         Returns:
             Dict containing validation results
         """
-        results = {
-            'summary': {'total_errors': 0, 'total_warnings': 0},
-            'errors': [],
-            'warnings': [],
-            'column_stats': {}
-        }
-        
-        # Import column utilities for case-insensitive matching
-        from .column_utils import find_column_case_insensitive
-        
-        # Validate each column (using case-insensitive matching)
-        for column, rules in self.validation_rules.items():
-            # Find column using case-insensitive matching
-            actual_column = find_column_case_insensitive(df, column)
-            
-            if actual_column is None:
-                if rules.get('required', False):
-                    results['errors'].append({
-                        'type': 'missing_column',
-                        'column': column,
-                        'message': f"Required column '{column}' is missing (case-insensitive search)"
-                    })
-                continue
-            
-            column_results = self._validate_column(df[actual_column], rules)
-            results['summary']['total_errors'] += len(column_results['errors'])
-            results['summary']['total_warnings'] += len(column_results['warnings'])
-            results['errors'].extend(column_results['errors'])
-            results['warnings'].extend(column_results['warnings'])
-            results['column_stats'][column] = column_results['stats']
-        
-        return results
+        return _validate_data(df, self.validation_rules, self)
     
-    def _validate_column(self, series: pd.Series, rules: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_column(self, series: pd.Series, rules: Dict[str, Any],
+                         now: Optional[pd.Timestamp] = None) -> Dict[str, Any]:
         """
         Validate a single column against its rules.
         
         Args:
             series: Column data
             rules: Validation rules
+            now: Reference time for future-date checks (defaults to the current time)
             
         Returns:
             Dict containing validation results for the column
         """
+        # Null positions feed the stats, the required check and the date check
+        null_mask = series.isna().to_numpy()
+        null_mask_positions = np.flatnonzero(null_mask)
+        
         results = {
             'errors': [],
             'warnings': [],
             'stats': {
                 'total_rows': len(series),
-                'null_count': series.isna().sum(),
+                'null_count': null_mask_positions.size,
                 'unique_count': series.nunique()
             }
         }
@@ -113,38 +156,42 @@ class DataValidator:
         
         # Check required
         if rules.get('required', False):
-            null_mask = series.isna()
-            null_count = null_mask.sum()
+            null_count = null_mask_positions.size
             if null_count > 0:
                 results['errors'].append({
                     'type': 'missing_values',
                     'column': column_name,
-                    'rows': null_mask[null_mask].index.tolist(),
+                    'rows': series.index.take(null_mask_positions).tolist(),
                     'message': f"Found {null_count} missing values in required column '{column_name}'"
                 })
         
         # Check uniqueness
         if rules.get('unique', False):
-            duplicates = series.duplicated()
-            duplicate_count = duplicates.sum()
+            duplicate_positions = np.flatnonzero(series.duplicated().to_numpy())
+            duplicate_count = duplicate_positions.size
             if duplicate_count > 0:
                 results['errors'].append({
                     'type': 'duplicate_values',
                     'column': column_name,
-                    'rows': duplicates[duplicates].index.tolist(),
+                    'rows': series.index.take(duplicate_positions).tolist(),
                     'message': f"Found {duplicate_count} duplicate values in column '{column_name}'"
                 })
         
         # Check format
         if 'format' in rules:
             try:
-                invalid_format = ~series.astype(str).str.match(rules['format'])
-                invalid_count = invalid_format.sum()
+                # String columns are matched in place; others are stringified first.
+                # Arrow-backed strings only accept the pattern source, not a compiled re.Pattern.
+                pattern = getattr(rules['format'], 'pattern', rules['format'])
+                strings = series if pd.api.types.is_string_dtype(series) else series.astype(str)
+                invalid_format = ~strings.str.match(pattern, na=False).to_numpy(dtype=bool, na_value=False)
+                invalid_format_positions = np.flatnonzero(invalid_format)
+                invalid_count = invalid_format_positions.size
                 if invalid_count > 0:
                     results['errors'].append({
                         'type': 'invalid_format',
                         'column': column_name,
-                        'rows': invalid_format[invalid_format].index.tolist(),
+                        'rows': series.index.take(invalid_format_positions).tolist(),
                         'message': f"Found {invalid_count} values with invalid format in column '{column_name}'"
                     })
             except Exception as e:
@@ -156,73 +203,85 @@ class DataValidator:
         
         # Check allowed values
         if 'allowed_values' in rules:
-            invalid_values = ~series.isin(rules['allowed_values'])
-            invalid_count = invalid_values.sum()
+            invalid_values = ~series.isin(rules['allowed_values']).to_numpy()
+            invalid_values_positions = np.flatnonzero(invalid_values)
+            invalid_count = invalid_values_positions.size
             if invalid_count > 0:
                 results['errors'].append({
                     'type': 'invalid_values',
                     'column': column_name,
-                    'rows': invalid_values[invalid_values].index.tolist(),
+                    'rows': series.index.take(invalid_values_positions).tolist(),
                     'message': f"Found {invalid_count} invalid values in column '{column_name}'"
                 })
         
         # Check numeric constraints
         if rules.get('type') == 'numeric':
-            non_numeric = ~pd.to_numeric(series, errors='coerce').notna()
-            non_numeric_count = non_numeric.sum()
+            # One float array feeds the non-numeric and range masks; NaN fails every comparison
+            numeric = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            # Missing values are reported by the required check, not as non-numeric
+            non_numeric = np.isnan(numeric) & ~null_mask
+            non_numeric_positions = np.flatnonzero(non_numeric)
+            non_numeric_count = non_numeric_positions.size
             if non_numeric_count > 0:
                 results['errors'].append({
                     'type': 'non_numeric',
                     'column': column_name,
-                    'rows': non_numeric[non_numeric].index.tolist(),
+                    'rows': series.index.take(non_numeric_positions).tolist(),
                     'message': f"Found {non_numeric_count} non-numeric values in column '{column_name}'"
                 })
             
             if 'min_value' in rules:
-                below_min = series < rules['min_value']
-                below_min_count = below_min.sum()
+                below_min = numeric < rules['min_value']
+                below_min_positions = np.flatnonzero(below_min)
+                below_min_count = below_min_positions.size
                 if below_min_count > 0:
                     results['errors'].append({
                         'type': 'below_minimum',
                         'column': column_name,
-                        'rows': below_min[below_min].index.tolist(),
+                        'rows': series.index.take(below_min_positions).tolist(),
                         'message': f"Found {below_min_count} values below minimum in column '{column_name}'"
                     })
             
             if 'max_value' in rules:
-                above_max = series > rules['max_value']
-                above_max_count = above_max.sum()
+                above_max = numeric > rules['max_value']
+                above_max_positions = np.flatnonzero(above_max)
+                above_max_count = above_max_positions.size
                 if above_max_count > 0:
                     results['errors'].append({
                         'type': 'above_maximum',
                         'column': column_name,
-                        'rows': above_max[above_max].index.tolist(),
+                        'rows': series.index.take(above_max_positions).tolist(),
                         'message': f"Found {above_max_count} values above maximum in column '{column_name}'"
                     })
         
         # Check date constraints
         if rules.get('type') == 'date':
-            # Convert to datetime
+            # Convert to datetime once; both date masks are derived from it
             dates = pd.to_datetime(series, errors='coerce')
-            invalid_dates = dates.isna() & ~series.isna()
-            invalid_count = invalid_dates.sum()
+            invalid_dates = dates.isna().to_numpy() & ~null_mask
+            invalid_dates_positions = np.flatnonzero(invalid_dates)
+            invalid_count = invalid_dates_positions.size
             if invalid_count > 0:
                 results['errors'].append({
                     'type': 'invalid_dates',
                     'column': column_name,
-                    'rows': invalid_dates[invalid_dates].index.tolist(),
+                    'rows': series.index.take(invalid_dates_positions).tolist(),
                     'message': f"Found {invalid_count} invalid dates in column '{column_name}'"
                 })
             
             if rules.get('not_future', False):
-                future_dates = dates > pd.Timestamp.now()
-                future_count = future_dates.sum()
-                if future_count > 0:
+                if now is None:
+                    now = pd.Timestamp.now()
+                # Scalar gate: the mask is only built when some date is in the future
+                if dates.max() > now:
+                    # NaT compares False, so unparsed dates are never flagged
+                    future_dates = dates.to_numpy() > now.to_datetime64()
+                    future_dates_positions = np.flatnonzero(future_dates)
                     results['errors'].append({
                         'type': 'future_dates',
                         'column': column_name,
-                        'rows': future_dates[future_dates].index.tolist(),
-                        'message': f"Found {future_count} future dates in column '{column_name}'"
+                        'rows': series.index.take(future_dates_positions).tolist(),
+                        'message': f"Found {future_dates_positions.size} future dates in column '{column_name}'"
                     })
         
         return results
@@ -246,31 +305,15 @@ class DataValidator:
         with col2:
             st.metric("Total Warnings", results['summary']['total_warnings'])
         
-        # Show errors
+        # Show errors, all in one element
         if results['errors']:
             st.write("### Errors")
-            for error in results['errors']:
-                error_message = []
-                if 'message' in error:
-                    error_message.append(error['message'])
-                if 'type' in error:
-                    error_message.append(f"Type: {error['type']}")
-                if 'rows' in error:
-                    error_message.append(f"Affected rows: {len(error['rows'])}")
-                st.error("\n".join(error_message))
+            st.error("\n".join(_format_issue(error) for error in results['errors']))
         
-        # Show warnings
+        # Show warnings, all in one element
         if results['warnings']:
             st.write("### Warnings")
-            for warning in results['warnings']:
-                warning_message = []
-                if 'message' in warning:
-                    warning_message.append(warning['message'])
-                if 'type' in warning:
-                    warning_message.append(f"Type: {warning['type']}")
-                if 'rows' in warning:
-                    warning_message.append(f"Affected rows: {len(warning['rows'])}")
-                st.warning("\n".join(warning_message))
+            st.warning("\n".join(_format_issue(warning) for warning in results['warnings']))
         
         # Show column statistics
         st.write("### Column Statistics")
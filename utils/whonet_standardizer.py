@@ -13,6 +13,58 @@ from typing import Dict, List, Any, Optional, Tuple
 import re
 from datetime import datetime
 
+from .helpers import map_unique
+
+# Column-name fragments marking antimicrobial result columns (SIR suffixes and
+# common WHONET drug codes such as "AMK_SIR" or "CIP")
+_AMR_COLUMN_RE = re.compile('|'.join([
+    'SIR', 'AMP', 'AMK', 'AMX', 'AZM', 'CAZ', 'CIP', 'CLI', 'CRO', 'CTX',
+    'ERY', 'GEN', 'IPM', 'MEM', 'PEN', 'TET', 'VAN'
+]))
+
+# First run of digits in a free-text age such as "45 years"
+_AGE_NUMBER_RE = re.compile(r'(\d+)')
+
+def _amr_columns(df: pd.DataFrame) -> List[str]:
+    """Return the columns that look like antimicrobial result columns."""
+    return [col for col in df.columns if _AMR_COLUMN_RE.search(col.upper())]
+
+def _sir_columns(df: pd.DataFrame) -> List[str]:
+    """Return the columns carrying WHONET SIR results."""
+    return [col for col in df.columns if 'SIR' in col]
+
+def _lookup_unique(series: pd.Series, mappings: Dict[str, str], normalize=str.lower) -> pd.Series:
+    """Look up each distinct value's normalized text in mappings; unmapped values become NaN."""
+    return map_unique(series, lambda value: mappings.get(normalize(str(value).strip())))
+
+def _bullet_list(items: List[str]) -> str:
+    """Join report messages into one markdown bullet list."""
+    return '\n'.join(f"- {item}" for item in items)
+
+def _substring_matcher(mappings: Dict[str, str]):
+    """
+    Compile mapping keys into one regex; the lookup returns the value of the
+    first-listed key contained in the text, as a loop over the keys would.
+    
+    A zero-width lookahead captures the longest key starting at every position,
+    so overlapping keys are all seen. Any shorter key matching at the same
+    position is a prefix of that capture, so each key is pre-resolved to the
+    first-listed key among its prefixes.
+    """
+    rank = {key: i for i, key in enumerate(mappings)}
+    resolved = {
+        key: min((k for k in mappings if key.startswith(k)), key=rank.__getitem__)
+        for key in mappings
+    }
+    alternatives = sorted(mappings, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, alternatives)) + '))')
+    
+    def match(text: str) -> Optional[str]:
+        hits = [resolved[hit] for hit in pattern.findall(text)]
+        return mappings[min(hits, key=rank.__getitem__)] if hits else None
+    
+    return match
+
 class WHONETStandardizer:
     """
     Comprehensive WHONET data standardization for non-technical users.
@@ -48,6 +100,27 @@ class WHONETStandardizer:
     
     # WHONET Antimicrobial Result Format
     WHONET_SIR_VALUES = ['S', 'R', 'I', 'ND', 'NM', 'MS', 'MR']
+    WHONET_SIR_DTYPE = pd.CategoricalDtype(WHONET_SIR_VALUES)
+    
+    # Upper-cased result variants mapped to WHONET SIR codes
+    SIR_RESULT_MAPPINGS = {
+        **{value: value for value in WHONET_SIR_VALUES},
+        'SUSCEPTIBLE': 'S',
+        'SENSITIVE': 'S',
+        'RESISTANT': 'R',
+        'RESISTANCE': 'R',
+        'INTERMEDIATE': 'I',
+        'NOT DETERMINED': 'ND',
+        'N/A': 'ND',
+        'NA': 'ND',
+        'NOT MEASURED': 'NM',
+    }
+    
+    # Upper-cased organism entries that mark a row as invalid
+    INVALID_ORGANISMS = frozenset(['XXX', 'TEST', 'NO GROWTH', 'CONTAMINATION', 'NOT APPLICABLE', 'NA', 'N/A'])
+    _INVALID_ORGANISM_RE = re.compile(
+        r'\s*(?:' + '|'.join(map(re.escape, sorted(INVALID_ORGANISMS))) + r')\s*', re.IGNORECASE
+    )
     
     # Organism name mappings (standardize to WHONET format)
     ORGANISM_MAPPINGS = {
@@ -104,6 +177,10 @@ class WHONETStandardizer:
         'other': 'OTHER'
     }
     
+    # Partial-match lookups compiled once from the mappings above
+    _match_organism = staticmethod(_substring_matcher(ORGANISM_MAPPINGS))
+    _match_specimen = staticmethod(_substring_matcher(SPECIMEN_TYPE_MAPPINGS))
+    
     # Sex/Gender mappings for WHONET
     SEX_MAPPINGS = {
         'male': 'M',
@@ -118,6 +195,16 @@ class WHONETStandardizer:
         'other': 'U'
     }
     
+    # Normalized column-name patterns mapped to WHONET columns, in priority order
+    COLUMN_NAME_RULES = [
+        (re.compile(r'organism|bacteria|isolate'), 'ORGANISM'),
+        (re.compile(r'^(?=.*specimen)(?=.*(?:date|collection))'), 'SPEC_DATE'),
+        (re.compile(r'^(?=.*specimen)(?=.*type)'), 'SPEC_TYPE'),
+        (re.compile(r'age'), 'AGE'),
+        (re.compile(r'sex|gender'), 'SEX'),
+        (re.compile(r'^(?=.*patient)(?=.*(?:id|number))'), 'PATIENT_ID'),
+    ]
+    
     def __init__(self):
         """Initialize WHONET standardizer."""
         self.cleaning_report = {
@@ -150,35 +237,44 @@ class WHONETStandardizer:
             }
         }
         
-        standardized_df = df.copy()
+        # Shallow copy: each step replaces whole columns, so untouched columns
+        # keep sharing their data with the input frame
+        standardized_df = df.copy(deep=False)
         
         # Step 1: Standardize column names to WHONET format
         standardized_df = self._standardize_column_names(standardized_df)
         
-        # Step 2: Standardize organism names
+        # Column names are final from here on; scan them for SIR result columns once
+        sir_columns = _sir_columns(standardized_df)
+        
+        # Step 2: Drop placeholder organism entries before the per-value passes
+        if auto_fix:
+            standardized_df = self._remove_invalid_organisms(standardized_df)
+        
+        # Step 3: Standardize organism names
         standardized_df = self._standardize_organisms(standardized_df)
         
-        # Step 3: Standardize specimen types
+        # Step 4: Standardize specimen types
         standardized_df = self._standardize_specimen_types(standardized_df)
         
-        # Step 4: Standardize sex/gender values
+        # Step 5: Standardize sex/gender values
         standardized_df = self._standardize_sex(standardized_df)
         
-        # Step 5: Standardize antimicrobial results (SIR format)
+        # Step 6: Standardize antimicrobial results (SIR format)
         standardized_df = self._standardize_antimicrobial_results(standardized_df)
         
-        # Step 6: Standardize dates to WHONET format
+        # Step 7: Standardize dates to WHONET format
         standardized_df = self._standardize_dates(standardized_df)
         
-        # Step 7: Standardize age values
+        # Step 8: Standardize age values
         standardized_df = self._standardize_age(standardized_df)
         
-        # Step 8: Remove invalid rows
+        # Step 9: Remove rows without antimicrobial results
         if auto_fix:
-            standardized_df = self._remove_invalid_rows(standardized_df)
+            standardized_df = self._remove_invalid_rows(standardized_df, sir_columns)
         
-        # Step 9: Validate WHONET requirements
-        validation_results = self._validate_whonet_requirements(standardized_df)
+        # Step 10: Validate WHONET requirements
+        validation_results = self._validate_whonet_requirements(standardized_df, sir_columns)
         
         self.cleaning_report['statistics']['rows_after_cleaning'] = len(standardized_df)
         self.cleaning_report['statistics']['columns_after_cleaning'] = len(standardized_df.columns)
@@ -191,34 +287,18 @@ class WHONETStandardizer:
         from .column_utils import normalize_column_name
         
         column_mapping = {}
+        used_targets = set()
         
         for col in df.columns:
             col_normalized = normalize_column_name(col)  # Case-insensitive, strip whitespace
             
-            # Map to WHONET standard column names (case-insensitive matching)
-            if any(term in col_normalized for term in ['organism', 'bacteria', 'isolate']):
-                if 'ORGANISM' not in column_mapping.values():
-                    column_mapping[col] = 'ORGANISM'
-            
-            elif 'specimen' in col_normalized and any(term in col_normalized for term in ['date', 'collection']):
-                if 'SPEC_DATE' not in column_mapping.values():
-                    column_mapping[col] = 'SPEC_DATE'
-            
-            elif 'specimen' in col_normalized and 'type' in col_normalized:
-                if 'SPEC_TYPE' not in column_mapping.values():
-                    column_mapping[col] = 'SPEC_TYPE'
-            
-            elif 'age' in col_normalized:
-                if 'AGE' not in column_mapping.values():
-                    column_mapping[col] = 'AGE'
-            
-            elif 'sex' in col_normalized or 'gender' in col_normalized:
-                if 'SEX' not in column_mapping.values():
-                    column_mapping[col] = 'SEX'
-            
-            elif 'patient' in col_normalized and any(term in col_normalized for term in ['id', 'number']):
-                if 'PATIENT_ID' not in column_mapping.values():
-                    column_mapping[col] = 'PATIENT_ID'
+            # The first matching rule decides the target; each target is assigned once
+            for pattern, target in self.COLUMN_NAME_RULES:
+                if pattern.search(col_normalized):
+                    if target not in used_targets:
+                        column_mapping[col] = target
+                        used_targets.add(target)
+                    break
         
         if column_mapping:
             df = df.rename(columns=column_mapping)
@@ -240,23 +320,19 @@ class WHONETStandardizer:
             if pd.isna(name):
                 return name
             
-            name_str = str(name).strip().lower()
+            name_stripped = str(name).strip()
+            name_str = name_stripped.lower()
             
             # Check direct mappings
             if name_str in self.ORGANISM_MAPPINGS:
                 return self.ORGANISM_MAPPINGS[name_str]
             
-            # Check partial matches
-            for key, value in self.ORGANISM_MAPPINGS.items():
-                if key in name_str:
-                    return value
-            
-            # Return title case if no mapping found
-            return str(name).strip().title()
+            # Check partial matches, falling back to title case
+            return self._match_organism(name_str) or name_stripped.title()
         
-        df['ORGANISM'] = df['ORGANISM'].apply(standardize_organism)
+        df['ORGANISM'] = map_unique(df['ORGANISM'], standardize_organism).astype('category')
         
-        new_count = df['ORGANISM'].nunique()
+        new_count = df['ORGANISM'].cat.categories.size
         if original_count != new_count:
             self.cleaning_report['issues_fixed'].append(
                 f"Standardized organism names: {original_count} → {new_count} unique values"
@@ -273,21 +349,16 @@ class WHONETStandardizer:
             if pd.isna(specimen):
                 return specimen
             
-            spec_str = str(specimen).strip().upper()
+            spec_str = str(specimen).strip().lower()
             
             # Check direct mappings
-            if spec_str.lower() in self.SPECIMEN_TYPE_MAPPINGS:
-                return self.SPECIMEN_TYPE_MAPPINGS[spec_str.lower()]
-            
-            # Check partial matches
-            for key, value in self.SPECIMEN_TYPE_MAPPINGS.items():
-                if key in spec_str.lower():
-                    return value
+            if spec_str in self.SPECIMEN_TYPE_MAPPINGS:
+                return self.SPECIMEN_TYPE_MAPPINGS[spec_str]
             
-            # Return uppercase if no mapping found
-            return spec_str
+            # Check partial matches, falling back to uppercase
+            return self._match_specimen(spec_str) or spec_str.upper()
         
-        df['SPEC_TYPE'] = df['SPEC_TYPE'].apply(standardize_specimen)
+        df['SPEC_TYPE'] = map_unique(df['SPEC_TYPE'], standardize_specimen).astype('category')
         self.cleaning_report['issues_fixed'].append("Standardized specimen type values to WHONET format")
         
         return df
@@ -297,18 +368,11 @@ class WHONETStandardizer:
         if 'SEX' not in df.columns:
             return df
         
-        def standardize_sex(sex):
-            if pd.isna(sex):
-                return 'U'  # Unknown default for WHONET
-            
-            sex_str = str(sex).strip().lower()
-            
-            if sex_str in self.SEX_MAPPINGS:
-                return self.SEX_MAPPINGS[sex_str]
-            
-            return 'U'  # Default to Unknown
-        
-        df['SEX'] = df['SEX'].apply(standardize_sex)
+        # Missing and unmapped values both default to Unknown
+        df['SEX'] = (
+            _lookup_unique(df['SEX'], self.SEX_MAPPINGS).fillna('U')
+            .astype(pd.CategoricalDtype(['M', 'F', 'U']))
+        )
         self.cleaning_report['issues_fixed'].append("Standardized sex values to WHONET format (M/F/U)")
         
         return df
@@ -316,46 +380,14 @@ class WHONETStandardizer:
     def _standardize_antimicrobial_results(self, df: pd.DataFrame) -> pd.DataFrame:
         """Standardize antimicrobial susceptibility results to WHONET SIR format."""
         # Find antimicrobial columns (columns that might contain SIR results)
-        antimicrobial_columns = []
-        
-        for col in df.columns:
-            col_upper = col.upper()
-            # WHONET typically uses column names like "AMK_SIR", "AMP_SIR", etc.
-            if '_SIR' in col_upper or 'SIR' in col_upper:
-                antimicrobial_columns.append(col)
-            # Also check for common antimicrobial abbreviations
-            elif any(abbrev in col_upper for abbrev in [
-                'AMP', 'AMK', 'AMX', 'AZM', 'CAZ', 'CIP', 'CLI', 'CRO', 'CTX',
-                'ERY', 'GEN', 'IPM', 'MEM', 'PEN', 'TET', 'VAN'
-            ]):
-                antimicrobial_columns.append(col)
+        antimicrobial_columns = _amr_columns(df)
         
         for col in antimicrobial_columns:
-            def standardize_result(value):
-                if pd.isna(value):
-                    return 'ND'  # Not Determined for WHONET
-                
-                value_str = str(value).strip().upper()
-                
-                # Direct match
-                if value_str in self.WHONET_SIR_VALUES:
-                    return value_str
-                
-                # Common variations
-                if value_str in ['SUSCEPTIBLE', 'SENSITIVE', 'S']:
-                    return 'S'
-                elif value_str in ['RESISTANT', 'RESISTANCE', 'R']:
-                    return 'R'
-                elif value_str in ['INTERMEDIATE', 'I']:
-                    return 'I'
-                elif value_str in ['NOT DETERMINED', 'ND', 'N/A', 'NA']:
-                    return 'ND'
-                elif value_str in ['NOT MEASURED', 'NM']:
-                    return 'NM'
-                
-                return 'ND'  # Default to Not Determined
-            
-            df[col] = df[col].apply(standardize_result)
+            # Missing and unrecognised results default to Not Determined
+            df[col] = (
+                _lookup_unique(df[col], self.SIR_RESULT_MAPPINGS, str.upper).fillna('ND')
+                .astype(self.WHONET_SIR_DTYPE)
+            )
         
         if antimicrobial_columns:
             self.cleaning_report['issues_fixed'].append(
@@ -370,10 +402,13 @@ class WHONETStandardizer:
         
         for col in date_columns:
             try:
-                # Convert to datetime
-                df[col] = pd.to_datetime(df[col], errors='coerce', infer_datetime_format=True)
-                # Format as YYYY-MM-DD
-                df[col] = df[col].dt.strftime('%Y-%m-%d')
+                # Convert to datetime: ISO dates on the fast path, generic parser for the rest
+                parsed = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce', cache=True)
+                unparsed = parsed.isna() & df[col].notna()
+                if unparsed.any():
+                    parsed[unparsed] = pd.to_datetime(df.loc[unparsed, col], errors='coerce', cache=True)
+                # Keep calendar dates as datetime64; to_whonet_export writes them as YYYY-MM-DD
+                df[col] = parsed.dt.normalize()
                 self.cleaning_report['issues_fixed'].append(f"Standardized date format for {col} to WHONET format (YYYY-MM-DD)")
             except Exception as e:
                 self.cleaning_report['warnings'].append(f"Could not standardize dates in {col}: {str(e)}")
@@ -385,48 +420,56 @@ class WHONETStandardizer:
         if 'AGE' not in df.columns:
             return df
         
-        def extract_age(age_value):
-            if pd.isna(age_value):
-                return None
-            
-            try:
-                # Try direct numeric conversion
-                age_num = float(age_value)
-                if 0 <= age_num <= 120:
-                    return int(age_num)
-            except (ValueError, TypeError):
-                pass
-            
-            # Try to extract number from string
-            age_str = str(age_value)
-            numbers = re.findall(r'\d+', age_str)
-            if numbers:
-                age_num = float(numbers[0])
-                if 0 <= age_num <= 120:
-                    return int(age_num)
-            
-            return None
+        # Direct numeric conversion first, then the first number found in the text
+        ages = df['AGE']
+        numeric = pd.to_numeric(ages, errors='coerce').astype(float)
+        retry = ~numeric.between(0, 120) & ages.notna()
+        if retry.any():
+            numeric[retry] = pd.to_numeric(
+                ages[retry].astype(str).str.extract(_AGE_NUMBER_RE, expand=False), errors='coerce'
+            )
         
-        df['AGE'] = df['AGE'].apply(extract_age)
+        df['AGE'] = np.trunc(numeric.where(numeric.between(0, 120))).astype('Int16')
         self.cleaning_report['issues_fixed'].append("Standardized age values to numeric")
         
         return df
     
-    def _remove_invalid_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _remove_invalid_organisms(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Remove rows whose organism is a placeholder such as TEST or N/A."""
+        if 'ORGANISM' not in df.columns:
+            return df
+        
+        # Test each distinct entry once (categories only, for categorical columns)
+        invalid = map_unique(
+            df['ORGANISM'], lambda name: self._INVALID_ORGANISM_RE.fullmatch(str(name)) is not None
+        ).to_numpy(dtype=bool, na_value=False)
+        
+        removed = int(invalid.sum())
+        if removed > 0:
+            df = df[~invalid]
+            self.cleaning_report['issues_fixed'].append(f"Removed {removed} rows with placeholder organism entries")
+        
+        return df
+    
+    def _remove_invalid_rows(self, df: pd.DataFrame,
+                             sir_columns: Optional[List[str]] = None) -> pd.DataFrame:
         """Remove rows that are clearly invalid."""
         original_len = len(df)
         
-        # Remove rows with invalid organism names
-        if 'ORGANISM' in df.columns:
-            invalid_organisms = ['XXX', 'TEST', 'NO GROWTH', 'CONTAMINATION', 'NOT APPLICABLE', 'NA', 'N/A']
-            df = df[~df['ORGANISM'].astype(str).str.upper().isin(invalid_organisms)]
-        
         # Remove rows where all antimicrobial results are missing
-        antimicrobial_cols = [col for col in df.columns if '_SIR' in col or 'SIR' in col]
+        antimicrobial_cols = _sir_columns(df) if sir_columns is None else sir_columns
         
         if antimicrobial_cols:
-            # Keep rows that have at least one antimicrobial result
-            df = df[df[antimicrobial_cols].notna().any(axis=1)]
+            # Keep rows that have at least one antimicrobial result, OR-ing one
+            # column at a time instead of building a full boolean frame
+            has_result = np.zeros(len(df), dtype=bool)
+            for col in antimicrobial_cols:
+                values = df[col]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    has_result |= values.cat.codes.to_numpy() != -1
+                else:
+                    has_result |= values.notna().to_numpy()
+            df = df[has_result]
         
         removed = original_len - len(df)
         if removed > 0:
@@ -434,7 +477,8 @@ class WHONETStandardizer:
         
         return df
     
-    def _validate_whonet_requirements(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_whonet_requirements(self, df: pd.DataFrame,
+                                      sir_columns: Optional[List[str]] = None) -> Dict[str, Any]:
         """Validate data against WHONET requirements."""
         validation = {
             'valid': True,
@@ -471,12 +515,23 @@ class WHONETStandardizer:
                 validation['warnings'].append(f"Very few organisms found: {unique_organisms}")
         
         # Check for antimicrobial data
-        antimicrobial_cols = [col for col in df.columns if '_SIR' in col or 'SIR' in col]
+        antimicrobial_cols = _sir_columns(df) if sir_columns is None else sir_columns
         if len(antimicrobial_cols) == 0:
             validation['warnings'].append("No antimicrobial susceptibility data found (no columns with '_SIR' suffix)")
         
         return validation
     
+    def to_whonet_export(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of df with datetime columns formatted as WHONET dates (YYYY-MM-DD)."""
+        date_columns = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col].dtype)]
+        if not date_columns:
+            return df
+        
+        export_df = df.copy(deep=False)
+        for col in date_columns:
+            export_df[col] = export_df[col].dt.strftime('%Y-%m-%d')
+        return export_df
+    
     def show_cleaning_report(self, report: Dict[str, Any]):
         """Display cleaning report in Streamlit."""
         st.write("### 🧹 WHONET Data Cleaning Report")
@@ -496,14 +551,12 @@ class WHONETStandardizer:
         # Issues fixed
         if report.get('issues_fixed'):
             st.success("✅ **Issues Fixed:**")
-            for issue in report['issues_fixed']:
-                st.write(f"- {issue}")
+            st.markdown(_bullet_list(report['issues_fixed']))
         
         # Warnings
         if report.get('warnings'):
             st.warning("⚠️ **Warnings:**")
-            for warning in report['warnings']:
-                st.write(f"- {warning}")
+            st.markdown(_bullet_list(report['warnings']))
         
         # Validation results
         if 'validation' in report:
@@ -514,17 +567,23 @@ class WHONETStandardizer:
             else:
                 st.error("❌ **WHONET Validation: FAILED**")
                 st.write("**Errors:**")
-                for error in validation.get('errors', []):
-                    st.write(f"- {error}")
+                st.markdown(_bullet_list(validation.get('errors', [])))
             
             if validation.get('warnings'):
                 st.write("**Validation Warnings:**")
-                for warning in validation['warnings']:
-                    st.write(f"- {warning}")
+                st.markdown(_bullet_list(validation['warnings']))
             
-            # Completeness scores
-            if validation.get('completeness_scores'):
+            # Completeness scores, rendered as one table instead of a bar per field
+            scores = validation.get('completeness_scores')
+            if scores:
                 st.write("**Data Completeness:**")
-                for field, score in validation['completeness_scores'].items():
-                    st.progress(score / 100, text=f"{field}: {score:.1f}%")
-
+                st.dataframe(
+                    pd.DataFrame({'Field': list(scores), 'Completeness': list(scores.values())}),
+                    column_config={
+                        'Completeness': st.column_config.ProgressColumn(
+                            'Completeness', format='%.1f%%', min_value=0, max_value=100
+                        )
+                    },
+                    hide_index=True,
+                    use_container_width=True
+                )
@@ -3,12 +3,71 @@ WHONET Data Preparation Wizard
 Step-by-step guided interface for non-technical users to prepare AMR data for WHONET import.
 """
 
+import hashlib
+from functools import cached_property
 import streamlit as st
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from .whonet_standardizer import WHONETStandardizer
 from .enhanced_quality_reporter import EnhancedQualityReporter
 
+
+# Rows sampled to estimate the deep memory footprint of large frames
+_MEMORY_SAMPLE_ROWS = 5_000
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _memory_usage_mb(df_key: bytes, _df: pd.DataFrame) -> float:
+    """
+    Deep memory footprint of a frame in MB, cached on its content digest.
+    
+    Large frames are measured on a fixed row sample and scaled up, so object
+    columns are not walked cell by cell.
+    """
+    n_rows = len(_df)
+    if n_rows <= _MEMORY_SAMPLE_ROWS:
+        return _df.memory_usage(deep=True).sum() / 1024 / 1024
+    
+    sample = _df.sample(_MEMORY_SAMPLE_ROWS, random_state=0)
+    columns_bytes = sample.memory_usage(index=False, deep=True).sum() * n_rows / _MEMORY_SAMPLE_ROWS
+    return (columns_bytes + _df.index.memory_usage(deep=True)) / 1024 / 1024
+
+
+def _frame_key(df: pd.DataFrame) -> bytes:
+    """Full-content digest of a dataframe, used as the cache key for the heavy wizard steps."""
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(df, index=True).values.tobytes(), digest_size=16)
+    digest.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    return digest.digest()
+
+
+def _session_frame_key(df: pd.DataFrame) -> bytes:
+    """
+    Content digest of the wizard's current frame, hashed once per frame.
+    
+    The digest is kept in session state with a reference to its frame, so
+    reruns that see the same (never mutated in place) object reuse it.
+    """
+    cached = st.session_state.get('whonet_wizard_df_key')
+    if cached is not None and cached['frame'] is df and cached['shape'] == df.shape:
+        return cached['key']
+    key = _frame_key(df)
+    st.session_state['whonet_wizard_df_key'] = {'frame': df, 'shape': df.shape, 'key': key}
+    return key
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _standardize_for_whonet(df_key: bytes, auto_fix: bool,
+                            _df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Run the WHONET standardization pipeline; cached on the data and auto_fix."""
+    return WHONETStandardizer().standardize_for_whonet(_df, auto_fix=auto_fix)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _quality_report(df_key: bytes, context: str, _df: pd.DataFrame) -> Dict[str, Any]:
+    """Build the comprehensive quality report; cached on the data and context."""
+    return EnhancedQualityReporter().generate_comprehensive_report(_df, context=context)
+
+
 class WHONETWizard:
     """
     Step-by-step wizard for WHONET data preparation.
@@ -16,11 +75,19 @@ class WHONETWizard:
     """
     
     def __init__(self):
-        self.standardizer = WHONETStandardizer()
-        self.quality_reporter = EnhancedQualityReporter()
         self.current_step = 0
         self.total_steps = 6
     
+    @cached_property
+    def standardizer(self) -> WHONETStandardizer:
+        """WHONET standardizer, created on first use."""
+        return WHONETStandardizer()
+    
+    @cached_property
+    def quality_reporter(self) -> EnhancedQualityReporter:
+        """Quality reporter, created on first use."""
+        return EnhancedQualityReporter()
+    
     def run_wizard(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
         Run the complete WHONET preparation wizard.
@@ -47,6 +114,14 @@ class WHONETWizard:
         
         st.markdown("---")
         
+        # Fast path: clean, rename and validate in one pipeline run, then export
+        if st.button("⚡ Run all steps at once", use_container_width=True,
+                     help="Clean, standardize and validate your data in one go, then go straight to export."):
+            with st.spinner("Cleaning and validating your data for WHONET..."):
+                df = self.run_all(df)
+            self.standardizer.show_cleaning_report(st.session_state['whonet_cleaning_report'])
+            return self._step_6_final_export(df)
+        
         # Step 1: Data Overview
         if self._step_1_data_overview(df):
             df = st.session_state.get('whonet_wizard_df', df)
@@ -80,6 +155,28 @@ class WHONETWizard:
         # Step 6: Final Export
         return self._step_6_final_export(df)
     
+    def run_all(self, df: pd.DataFrame, auto_fix: bool = True) -> pd.DataFrame:
+        """
+        Run cleaning and validation in a single pass, without the interactive steps.
+        
+        standardize_for_whonet already renames columns to WHONET names and
+        validates its result, so its report supplies the validation as well.
+        
+        Args:
+            df: Input dataframe
+            auto_fix: Whether to automatically fix common issues
+            
+        Returns:
+            Standardized dataframe ready for WHONET import
+        """
+        cleaned_df, report = _standardize_for_whonet(_session_frame_key(df), auto_fix, df)
+        
+        st.session_state['whonet_wizard_df'] = cleaned_df
+        st.session_state['whonet_cleaning_report'] = report
+        st.session_state['whonet_validation'] = report['validation']
+        
+        return cleaned_df
+    
     def _step_1_data_overview(self, df: pd.DataFrame) -> bool:
         """Step 1: Show data overview and get user confirmation."""
         st.header("Step 1 of 6: Data Overview")
@@ -90,17 +187,20 @@ class WHONETWizard:
         with col2:
             st.metric("Total Columns", len(df.columns))
         with col3:
-            st.metric("Data Size", f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB")
+            data_size = _memory_usage_mb(_session_frame_key(df), df)
+            label = "Data Size (est.)" if len(df) > _MEMORY_SAMPLE_ROWS else "Data Size"
+            st.metric(label, f"{data_size:.1f} MB")
         
         st.write("### Your Data Preview")
         st.dataframe(df.head(10), use_container_width=True)
         
         st.write("### Column Information")
+        non_empty = df.count()
         col_info = pd.DataFrame({
             'Column Name': df.columns,
-            'Data Type': [str(df[col].dtype) for col in df.columns],
-            'Non-Empty Values': [df[col].notna().sum() for col in df.columns],
-            'Empty Values': [df[col].isna().sum() for col in df.columns]
+            'Data Type': df.dtypes.astype(str).to_numpy(),
+            'Non-Empty Values': non_empty.to_numpy(),
+            'Empty Values': (len(df) - non_empty).to_numpy()
         })
         st.dataframe(col_info, use_container_width=True)
         
@@ -114,7 +214,8 @@ class WHONETWizard:
         col1, col2 = st.columns(2)
         with col1:
             if st.button("✅ Yes, my data looks good", type="primary", use_container_width=True):
-                st.session_state['whonet_wizard_df'] = df.copy()
+                # No copy needed: later steps build new frames instead of mutating this one
+                st.session_state['whonet_wizard_df'] = df
                 return True
         with col2:
             if st.button("❌ No, I need to upload different data", use_container_width=True):
@@ -146,7 +247,7 @@ class WHONETWizard:
         
         if st.button("🧹 Start Automatic Cleaning", type="primary", use_container_width=True):
             with st.spinner("Cleaning your data for WHONET... This may take a moment."):
-                cleaned_df, report = self.standardizer.standardize_for_whonet(df, auto_fix=auto_fix)
+                cleaned_df, report = _standardize_for_whonet(_session_frame_key(df), auto_fix, df)
                 
                 st.session_state['whonet_wizard_df'] = cleaned_df
                 st.session_state['whonet_cleaning_report'] = report
@@ -187,21 +288,25 @@ class WHONETWizard:
         st.write("**Required:** " + ", ".join(required_fields))
         st.write("**Optional:** " + ", ".join(optional_fields))
         
+        # Columns already carry the WHONET names (e.g. after automatic cleaning)
+        present_columns = set(df.columns)
+        if all(field in present_columns for field in required_fields):
+            st.success("✅ All required WHONET fields are already present. No mapping needed!")
+            return st.button("✅ Continue", type="primary", use_container_width=True)
+        
         # Auto-detect mappings
         st.write("### Automatic Column Detection:")
         detected_mappings = {}
         
-        from utils.column_utils import normalize_column_name, match_column_name
+        from utils.column_utils import normalize_column_name
+        
+        # Normalize each column once (case-insensitive, whitespace-insensitive)
+        normalized_columns = [(normalize_column_name(col), col) for col in df.columns]
         
         for field in required_fields + optional_fields:
-            # Try to find matching column (case-insensitive, whitespace-insensitive)
-            for col in df.columns:
-                if match_column_name(col, field):
-                    detected_mappings[field] = col
-                    break
-                # Also check substring match
-                col_normalized = normalize_column_name(col)
-                field_normalized = normalize_column_name(field)
+            # First column that matches the field exactly or by substring
+            field_normalized = normalize_column_name(field)
+            for col_normalized, col in normalized_columns:
                 if field_normalized in col_normalized or col_normalized in field_normalized:
                     detected_mappings[field] = col
                     break
@@ -240,7 +345,7 @@ class WHONETWizard:
         
         if st.button("📊 Generate Quality Report", type="primary", use_container_width=True):
             with st.spinner("Analyzing data quality..."):
-                quality_report = self.quality_reporter.generate_comprehensive_report(df, context='whonet')
+                quality_report = _quality_report(_session_frame_key(df), 'whonet', df)
                 
                 st.session_state['whonet_quality_report'] = quality_report
                 
@@ -287,10 +392,22 @@ class WHONETWizard:
                 # Completeness scores
                 if validation.get('completeness_scores'):
                     st.write("### Data Completeness:")
-                    for field, score in validation['completeness_scores'].items():
-                        color = "🟢" if score >= 80 else "🟡" if score >= 50 else "🔴"
-                        st.write(f"{color} **{field}**: {score:.1f}% complete")
-                        st.progress(score / 100)
+                    scores = pd.Series(validation['completeness_scores'], dtype=float).sort_values(ascending=False)
+                    st.dataframe(
+                        pd.DataFrame({
+                            'Status': pd.cut(scores, [-float('inf'), 50, 80, float('inf')],
+                                             labels=['🔴', '🟡', '🟢'], right=False).astype(str),
+                            'Field': scores.index,
+                            'Completeness': scores.to_numpy()
+                        }),
+                        column_config={
+                            'Completeness': st.column_config.ProgressColumn(
+                                'Completeness', format='%.1f%%', min_value=0, max_value=100
+                            )
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
                 
                 st.session_state['whonet_validation'] = validation
                 